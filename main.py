@@ -103,6 +103,12 @@ Examples:
         default=3,
         help='Number of API retry attempts (default: 3)'
     )
+    api_group.add_argument(
+        '--grok-batch-size',
+        type=int,
+        default=1,
+        help='Manuscripts packed into each Grok classification request (default: 1)'
+    )
     
     # Processing options
     proc_group = parser.add_argument_group('Processing Options')
@@ -123,6 +129,18 @@ Examples:
         default=6,
         help='Maximum tokens in location name (default: 6)'
     )
+    proc_group.add_argument(
+        '--extraction-workers',
+        type=int,
+        default=1,
+        help='Worker processes for regex entity extraction (0 = one per CPU; default: 1)'
+    )
+    proc_group.add_argument(
+        '--output-workers',
+        type=int,
+        default=1,
+        help='Worker processes for CSV exports and RDF graph building (0 = one per CPU; default: 1)'
+    )
     
     # Ontology namespaces (advanced)
     onto_group = parser.add_argument_group('Ontology Configuration (Advanced)')
@@ -256,12 +274,15 @@ def main():
         use_grok=not args.no_grok,
         ai_only=args.ai_only,
         use_kima=args.use_kima,
+        extraction_workers=args.extraction_workers,
+        output_workers=args.output_workers,
         
         # API
         grok_api_key=api_key,
         grok_max_workers=args.workers,
         grok_retries=args.retries,
         grok_timeout=args.timeout,
+        grok_batch_size=args.grok_batch_size,
         
         # Ontology
         base_namespace=args.base_namespace,
@@ -6,7 +6,8 @@ Isolates side effects (API calls) from pure logic
 import json
 import time
 import random
-from typing import List, Dict, Optional
+import threading
+from typing import List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from tqdm import tqdm
@@ -601,7 +602,11 @@ PERSON_ROLE_ONTOLOGY_MAPPING = {
 }
 
 
-@lru_cache(maxsize=100)
+# Unbounded: labels come from the closed label sets and pattern roles (141
+# labels, more than the old maxsize of 100), and every entity with a label
+# should share its one mapping dict. Callers must not mutate the result; it
+# stays a plain dict because events carrying it are pickled to worker processes.
+@lru_cache(maxsize=None)
 def get_ontology_mapping(label: str) -> Dict[str, str]:
     """Pure function: Get ontology mapping for classification label"""
     return (EVENT_TYPE_ONTOLOGY_MAPPING.get(label) or 
@@ -626,19 +631,24 @@ class GrokClassifier:
         max_workers: int = 8,
         chunk_size: int = 8,
         retries: int = 3,
-        timeout: int = 35
+        timeout: int = 35,
+        batch_size: int = 1
     ):
         self.api_key = api_key
         self.max_workers = max_workers
         self.chunk_size = chunk_size
         self.retries = retries
         self.timeout = timeout
+        self.batch_size = batch_size
+        # Caps requests in flight at max_workers however calls are nested
+        self._request_slots = threading.Semaphore(max_workers)
         self.api_url = "https://api.x.ai/v1/chat/completions"
     
     def classify_entities(
         self,
         text: str,
-        entities: List[ExtractedEntity]
+        entities: List[ExtractedEntity],
+        nested: bool = False
     ) -> List[ClassifiedEntity]:
         """
         Classify entities using Grok API
@@ -646,6 +656,8 @@ class GrokClassifier:
         Args:
             text: Source text context
             entities: List of extracted entities
+            nested: Running on a thread of classify_entities_batch(): chunks
+                    are sent one after another, without progress output
             
         Returns:
             List of classified entities with labels
@@ -662,12 +674,104 @@ class GrokClassifier:
             classified = self._classify_batch(
                 text=text,
                 entities=type_entities,
-                entity_type=entity_type
+                entity_type=entity_type,
+                nested=nested
             )
             all_classified.extend(classified)
         
         return all_classified
     
+    def classify_entities_batch(
+        self,
+        texts_and_entities: List[Tuple[str, List[ExtractedEntity]]],
+        batch_size: Optional[int] = None
+    ) -> List[List[ClassifiedEntity]]:
+        """
+        Classify entities of many texts, packing several texts into each API call
+        
+        One request covers up to batch_size texts and one entity type (each
+        type has its own label set), and at most chunk_size * batch_size
+        entities (larger batches are split, a text's entities across requests
+        if need be); requests run on max_workers threads.
+        With batch_size 1 this is classify_entities() per text, with up to
+        max_workers texts in flight (each sending its chunks serially, so
+        there is one thread pool and one progress bar).
+        
+        Args:
+            texts_and_entities: (source text, extracted entities) pairs
+            batch_size: Texts per request (default: the classifier's batch_size)
+            
+        Returns:
+            Classified entities per input pair, in input order
+        """
+        batch_size = batch_size or self.batch_size
+        if batch_size <= 1:
+            # Network-bound, so texts are classified side by side on threads
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(self.classify_entities, text, entities, nested=True)
+                    for text, entities in texts_and_entities
+                ]
+                return [
+                    future.result()
+                    for future in tqdm(futures, desc="AI classification", unit="ms")
+                ]
+        
+        # (entity type, document indices, documents) per request; capping the
+        # entities per request bounds what one failed response can lose
+        max_entities = max(1, self.chunk_size * batch_size)
+        requests_to_send = []
+        for start in range(0, len(texts_and_entities), batch_size):
+            by_type: Dict[EntityType, Tuple[List[int], List[Tuple[str, List[ExtractedEntity]]]]] = {}
+            for index in range(start, min(start + batch_size, len(texts_and_entities))):
+                text, entities = texts_and_entities[index]
+                for entity_type, type_entities in self._group_by_type(entities).items():
+                    indices, documents = by_type.setdefault(entity_type, ([], []))
+                    indices.append(index)
+                    documents.append((text, type_entities))
+            requests_to_send.extend(
+                (entity_type, request_indices, request_documents)
+                for entity_type, (indices, documents) in by_type.items()
+                for request_indices, request_documents in self._split_documents(
+                    indices, documents, max_entities
+                )
+            )
+        
+        responses: List[List[List[ClassifiedEntity]]] = [[] for _ in requests_to_send]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._classify_documents, documents, entity_type): position
+                for position, (entity_type, _, documents) in enumerate(requests_to_send)
+            }
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="  API calls (batched)",
+                unit="batch",
+                leave=False
+            ):
+                try:
+                    responses[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"\nClassification error: {e}")
+        
+        # Merge each text's types in classify_entities()' type order (within a
+        # type, pattern matches come first, then the answers in response order)
+        by_text: List[Dict[EntityType, List[ClassifiedEntity]]] = [{} for _ in texts_and_entities]
+        for (entity_type, indices, _), response in zip(requests_to_send, responses):
+            for index, classified in zip(indices, response):
+                by_text[index].setdefault(entity_type, []).extend(classified)
+        
+        return [
+            [
+                entity
+                for entity_type in self._group_by_type(entities)
+                for entity in by_type.get(entity_type, ())
+            ]
+            for (_, entities), by_type in zip(texts_and_entities, by_text)
+        ]
+    
     def _group_by_type(
         self,
         entities: List[ExtractedEntity]
@@ -684,11 +788,15 @@ class GrokClassifier:
         self,
         text: str,
         entities: List[ExtractedEntity],
-        entity_type: EntityType
+        entity_type: EntityType,
+        nested: bool = False
     ) -> List[ClassifiedEntity]:
         """
         Classify batch of entities of same type
         HYBRID APPROACH: Hebrew patterns FIRST → Grok API fallback
+        
+        Nested calls (see classify_entities) skip the inner thread pool and
+        the progress output.
         """
         
         # Get appropriate labels
@@ -705,15 +813,17 @@ class GrokClassifier:
         unclassified_values = unique_values
         
         if entity_type == EntityType.PERSON and HEBREW_PATTERNS_AVAILABLE:
-            print(f"    🔍 Regex patterns: Checking {len(unique_values)} persons...")
+            if not nested:
+                print(f"    🔍 Regex patterns: Checking {len(unique_values)} persons...")
             pattern_results = classify_persons_batch(text, unique_values)
             
             # Count successes
-            classified_by_pattern = sum(1 for v in pattern_results.values() if v)
             unclassified_values = [v for v, role in pattern_results.items() if not role]
             
-            print(f"    ✅ Regex classified: {classified_by_pattern}/{len(unique_values)}")
-            print(f"    ⏩ Grok fallback needed: {len(unclassified_values)}")
+            if not nested:
+                classified_by_pattern = sum(1 for v in pattern_results.values() if v)
+                print(f"    ✅ Regex classified: {classified_by_pattern}/{len(unique_values)}")
+                print(f"    ⏩ Grok fallback needed: {len(unclassified_values)}")
         
         # ========== STEP 2: Grok API for remaining entities ==========
         all_results = dict(pattern_results)  # Start with pattern results
@@ -722,29 +832,40 @@ class GrokClassifier:
             # Split into chunks
             chunks = self._create_chunks(unclassified_values, self.chunk_size)
             
-            # Parallel API calls with progress tracking
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = [
-                    executor.submit(
-                        self._classify_chunk,
-                        text, chunk, entity_type.value, labels, entity_map
-                    )
-                    for chunk in chunks
-                ]
-                
-                # Progress bar for API calls
-                for future in tqdm(
-                    as_completed(futures), 
-                    total=len(futures), 
-                    desc=f"  API calls ({entity_type.value})", 
-                    unit="batch",
-                    leave=False
-                ):
+            if nested:
+                # Already on an outer pool thread: no second pool (up to
+                # max_workers² threads) or interleaved progress bars
+                for chunk in chunks:
                     try:
-                        result = future.result()
-                        all_results.update(result)  # Merge Grok results
+                        all_results.update(self._classify_chunk(
+                            text, chunk, entity_type.value, labels, entity_map
+                        ))
                     except Exception as e:
                         print(f"\nClassification error: {e}")
+            else:
+                # Parallel API calls with progress tracking
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self._classify_chunk,
+                            text, chunk, entity_type.value, labels, entity_map
+                        )
+                        for chunk in chunks
+                    ]
+                    
+                    # Progress bar for API calls
+                    for future in tqdm(
+                        as_completed(futures), 
+                        total=len(futures), 
+                        desc=f"  API calls ({entity_type.value})", 
+                        unit="batch",
+                        leave=False
+                    ):
+                        try:
+                            result = future.result()
+                            all_results.update(result)  # Merge Grok results
+                        except Exception as e:
+                            print(f"\nClassification error: {e}")
         
         # ========== STEP 3: Build classified entities ==========
         classified = []
@@ -770,16 +891,92 @@ class GrokClassifier:
     ) -> Dict[str, str]:
         """Make API call for one chunk - isolated side effect"""
         
-        try:
-            import requests
-        except ImportError:
-            print("Warning: requests library not available")
-            return {}
-        
         # IMPORTANT: Send FULL text for proper context (like AI-only mode)
         # Grok can handle long inputs, and location context might be anywhere in the text
+        prompt = {
+            "text": text,  # FULL TEXT - no truncation!
+            "entities": self._entity_info(items, entity_map),  # Entity info with original forms
+            "item_kind": item_kind,
+            "labels": labels,
+            "instruction": self._get_instruction_v2(item_kind)  # Enhanced instruction
+        }
+        
+        mapping = self._request_mapping(prompt)
+        
+        # Validate results
+        return {k: v for k, v in mapping.items() if v in labels}
+    
+    def _classify_documents(
+        self,
+        documents: List[Tuple[str, List[ExtractedEntity]]],
+        entity_type: EntityType
+    ) -> List[List[ClassifiedEntity]]:
+        """
+        Classify one entity type for several texts in a single API call
+        
+        Args:
+            documents: (text, entities of entity_type) pairs
+            entity_type: Type shared by all entities
+            
+        Returns:
+            Classified entities per document, in input order
+        """
+        labels = list(get_labels_for_entity_type(entity_type))
+        entity_maps = [{e.value: e for e in entities} for _, entities in documents]
+        results: List[Dict[str, str]] = [{} for _ in documents]
+        
+        # Persons go through the Hebrew patterns first, as in _classify_batch
+        pending = []
+        for index, entity_map in enumerate(entity_maps):
+            values = list(entity_map)
+            if entity_type == EntityType.PERSON and HEBREW_PATTERNS_AVAILABLE:
+                results[index] = {v: role for v, role in classify_persons_batch(documents[index][0], values).items() if role}
+                values = [v for v in values if v not in results[index]]
+            if values:
+                pending.append((index, values))
+        
+        if pending:
+            prompt = {
+                "documents": [
+                    {
+                        "id": str(index),
+                        "text": documents[index][0],  # FULL TEXT - no truncation!
+                        "entities": self._entity_info(values, entity_maps[index]),
+                    }
+                    for index, values in pending
+                ],
+                "item_kind": entity_type.value,
+                "labels": labels,
+                "instruction": self._get_batch_instruction(entity_type.value)
+            }
+            mapping = self._request_mapping(prompt)
+            
+            for index, _ in pending:
+                document_mapping = mapping.get(str(index))
+                if isinstance(document_mapping, dict):
+                    results[index].update(
+                        (k, v) for k, v in document_mapping.items() if v in labels
+                    )
         
-        # Build entity information including original matched forms (for Kima locations)
+        return [
+            [
+                ClassifiedEntity(
+                    entity=entity_maps[index][value],
+                    label=label,
+                    ontology_mapping=get_ontology_mapping(label)
+                )
+                for value, label in document_results.items()
+                if value in entity_maps[index]
+            ]
+            for index, document_results in enumerate(results)
+        ]
+    
+    @staticmethod
+    def _entity_info(
+        items: List[str],
+        entity_map: Optional[Dict[str, ExtractedEntity]]
+    ) -> List[Dict[str, str]]:
+        """Pure function: Entity names plus original matched forms (for Kima locations)"""
         entity_info = []
         for item in items:
             entity_data = {"name": item}
@@ -791,50 +988,51 @@ class GrokClassifier:
                     entity_data["original_form"] = entity.metadata['matched_phrase']
             
             entity_info.append(entity_data)
+        return entity_info
+    
+    def _request_mapping(self, prompt: Dict) -> Dict:
+        """Post one prompt and return the JSON object Grok answers with ({} on failure) - isolated side effect"""
         
-        prompt = {
-            "text": text,  # FULL TEXT - no truncation!
-            "entities": entity_info,  # Entity info with original forms
-            "item_kind": item_kind,
-            "labels": labels,
-            "instruction": self._get_instruction_v2(item_kind)  # Enhanced instruction
-        }
+        try:
+            import requests
+        except ImportError:
+            print("Warning: requests library not available")
+            return {}
         
         for attempt in range(self.retries):
             try:
-                response = requests.post(
-                    self.api_url,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {self.api_key}",
-                    },
-                    json={
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": self._get_system_prompt()
-                            },
-                            {
-                                "role": "user",
-                                "content": json.dumps(prompt, ensure_ascii=False)
-                            }
-                        ],
-                        "model": "grok-4-fast-non-reasoning",
-                        "stream": False,
-                        "temperature": 0.0,
-                    },
-                    timeout=self.timeout
-                )
+                with self._request_slots:
+                    response = requests.post(
+                        self.api_url,
+                        headers={
+                            "Content-Type": "application/json",
+                            "Authorization": f"Bearer {self.api_key}",
+                        },
+                        json={
+                            "messages": [
+                                {
+                                    "role": "system",
+                                    "content": self._get_system_prompt()
+                                },
+                                {
+                                    "role": "user",
+                                    "content": json.dumps(prompt, ensure_ascii=False)
+                                }
+                            ],
+                            "model": "grok-4-fast-non-reasoning",
+                            "stream": False,
+                            "temperature": 0.0,
+                        },
+                        timeout=self.timeout
+                    )
                 
                 response.raise_for_status()
                 data = response.json()
                 content = data.get("choices", [{}])[0].get("message", {}).get("content", "{}")
                 mapping = json.loads(content)
                 
-                # Validate results
                 if isinstance(mapping, dict):
-                    return {k: v for k, v in mapping.items() 
-                           if v in labels}
+                    return mapping
                 
             except Exception as e:
                 if attempt == self.retries - 1:
@@ -946,11 +1144,59 @@ class GrokClassifier:
             f"Return JSON mapping canonical names to labels: {{\"canonical_name\": \"label\"}}"
         )
     
+    @staticmethod
+    def _get_batch_instruction(item_kind: str) -> str:
+        """Pure function: Instruction for prompts covering several documents"""
+        return (
+            GrokClassifier._get_instruction_v2(item_kind) + "\n\n"
+            f"This request contains several independent 'documents', each with its own 'id', "
+            f"'text' and 'entities'. Classify each document's entities using only that document's text.\n"
+            f"Return JSON keyed by document id: {{\"<id>\": {{\"canonical_name\": \"label\"}}}}"
+        )
+    
     @staticmethod
     def _create_chunks(items: List[str], chunk_size: int) -> List[List[str]]:
         """Pure function: Split list into chunks"""
         return [items[i:i + chunk_size] 
                 for i in range(0, len(items), chunk_size)]
+    
+    @staticmethod
+    def _split_documents(
+        indices: List[int],
+        documents: List[Tuple[str, List[ExtractedEntity]]],
+        max_entities: int
+    ) -> List[Tuple[List[int], List[Tuple[str, List[ExtractedEntity]]]]]:
+        """
+        Pure function: Pack one type's documents into requests of at most max_entities entities
+        
+        Args:
+            indices: Text index of each document
+            documents: (text, entities) pairs, in order
+            max_entities: Entity cap per request
+            
+        Returns:
+            (text indices, documents) per request; a document with more
+            entities than the cap is split (by distinct value) across requests
+        """
+        requests = []
+        request_indices: List[int] = []
+        request_documents: List[Tuple[str, List[ExtractedEntity]]] = []
+        count = 0
+        for index, (text, entities) in zip(indices, documents):
+            # One entity per value, as the prompt lists them (the last one
+            # wins, as in the entity maps), so no value lands in two requests
+            entities = list({e.value: e for e in entities}.values())
+            for start in range(0, len(entities), max_entities):
+                part = entities[start:start + max_entities]
+                if request_documents and count + len(part) > max_entities:
+                    requests.append((request_indices, request_documents))
+                    request_indices, request_documents, count = [], [], 0
+                request_indices.append(index)
+                request_documents.append((text, part))
+                count += len(part)
+        if request_documents:
+            requests.append((request_indices, request_documents))
+        return requests
 
 
 # ============================================================================
@@ -975,5 +1221,6 @@ def create_classifier(config) -> Optional[GrokClassifier]:
         max_workers=config.grok_max_workers,
         chunk_size=config.grok_chunk_size,
         retries=config.grok_retries,
-        timeout=config.grok_timeout
+        timeout=config.grok_timeout,
+        batch_size=config.grok_batch_size
     )
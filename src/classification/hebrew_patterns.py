@@ -10,6 +10,12 @@ Fallback to Grok API if patterns don't match.
 import re
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+
+
+# Memoized (text, name) classifications: a manuscript's notes are classified
+# once per person and location, and duplicate notes recur across a corpus
+PATTERN_CACHE_SIZE = 50_000
 
 
 @dataclass(frozen=True)
@@ -330,10 +336,67 @@ ALL_PERSON_PATTERNS = [
 ]
 
 
+def _compile_role_patterns(pattern_sets: List[HebrewPattern]) -> Tuple[Tuple[str, re.Pattern], ...]:
+    """
+    Pure helper: compile each pattern set into one case-insensitive alternation
+    
+    A set matches when any of its patterns does, so the alternation answers
+    the same question in a single search.
+    
+    Args:
+        pattern_sets: Pattern sets in order of precedence
+        
+    Returns:
+        (role, compiled pattern) pairs in the same order
+    """
+    return tuple(
+        (pattern_set.role, re.compile('|'.join(f'(?:{p})' for p in pattern_set.patterns), re.IGNORECASE))
+        for pattern_set in pattern_sets
+    )
+
+
+# Compiled once at import; the classifiers iterate these instead of going
+# through re's compile cache for every pattern of every call
+_PERSON_ROLE_PATTERNS = _compile_role_patterns(ALL_PERSON_PATTERNS)
+_LOCATION_ROLE_PATTERNS = _compile_role_patterns(ALL_LOCATION_PATTERNS)
+
+# Country suffix of a location name, e.g. "דמשק (סוריה)"
+_COUNTRY_SUFFIX = re.compile(r'\s*\([^)]+\)\s*$')
+
+# Context heuristics for locations no explicit pattern classifies
+_COLOPHON_CONTEXT = re.compile(r'קולופון|נשלם\s+(?:בעיר)?|הועתק|נכתב(?:\s+בעיר)?', re.IGNORECASE)
+_PRESERVATION_CONTEXT = re.compile(r'ספריית|באוסף|בעלות|בידי|נמצא\s+ב|שמור\s+ב|repository|archive', re.IGNORECASE)
+_PROVENANCE_CONTEXT = re.compile(r'מאוסף|לפנים|בעבר|מיד|הועבר|נמכר|לקוח', re.IGNORECASE)
+_RESIDENCE_CONTEXT = re.compile(r'גר\s+ב|ישב\s+ב|דר\s+ב|מושבו|עיר|חי\s+ב', re.IGNORECASE)
+_LIST_SEPARATOR = re.compile(r'[,;]\s*(?:ו)?(?:ג)?[אב-ת]')
+_SUBJECT_CONTEXT = re.compile(r'נושא|subject|subject matter|תחום', re.IGNORECASE)
+
+
 # ============================================================================
 # PATTERN MATCHING FUNCTIONS
 # ============================================================================
 
+def _find_ignorecase(text: str, literal: str) -> Optional[Tuple[int, int]]:
+    """
+    Pure helper: span of the first case-insensitive occurrence of literal
+    
+    Caseless literals (Hebrew names) match exactly what re.IGNORECASE would,
+    so they take a plain str.find() instead of compiling a regex per name.
+    
+    Args:
+        text: Text to search
+        literal: Literal string to find
+        
+    Returns:
+        (start, end) of the first match, or None
+    """
+    if literal == literal.lower() == literal.upper():
+        start = text.find(literal)
+        return (start, start + len(literal)) if start != -1 else None
+    match = re.search(re.escape(literal), text, re.IGNORECASE)
+    return match.span() if match else None
+
+
 def extract_person_context(text: str, person_name: str, context_window: int = 100) -> str:
     """
     Extract text context around person name
@@ -347,14 +410,13 @@ def extract_person_context(text: str, person_name: str, context_window: int = 10
         Context text around person name
     """
     # Find person name in text
-    person_clean = re.escape(person_name)
-    match = re.search(person_clean, text, re.IGNORECASE)
+    span = _find_ignorecase(text, person_name)
     
-    if not match:
+    if not span:
         return text[:500]  # Return beginning if name not found
     
-    start = max(0, match.start() - context_window)
-    end = min(len(text), match.end() + context_window)
+    start = max(0, span[0] - context_window)
+    end = min(len(text), span[1] + context_window)
     
     return text[start:end]
 
@@ -375,14 +437,26 @@ def classify_person_by_patterns(
     Returns:
         Role label if pattern matches, None otherwise
     """
+    if patterns is ALL_PERSON_PATTERNS:
+        return _classify_person_cached(text, person_name)
+    return _classify_person(text, person_name, _compile_role_patterns(patterns))
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _classify_person_cached(text: str, person_name: str) -> Optional[str]:
+    """classify_person_by_patterns() with the default patterns, memoized"""
+    return _classify_person(text, person_name, _PERSON_ROLE_PATTERNS)
+
+
+def _classify_person(text: str, person_name: str, patterns: Tuple[Tuple[str, re.Pattern], ...]) -> Optional[str]:
+    """Uncached body of classify_person_by_patterns()"""
     # Get context around person name
     context = extract_person_context(text, person_name)
     
     # Check each pattern in order of precedence
-    for pattern_set in patterns:
-        for pattern in pattern_set.patterns:
-            if re.search(pattern, context, re.IGNORECASE):
-                return pattern_set.role
+    for role, pattern in patterns:
+        if pattern.search(context):
+            return role
     
     return None  # No pattern matched
 
@@ -428,7 +502,7 @@ def extract_location_context(text: str, location_name: str, context_window: int
     """
     # Clean location name - remove country suffix in parentheses
     # e.g., "דמשק (סוריה)" → "דמשק"
-    location_base = re.sub(r'\s*\([^)]+\)\s*$', '', location_name).strip()
+    location_base = _COUNTRY_SUFFIX.sub('', location_name).strip()
     
     # Try to find the location in different forms:
     # 1. With ב prefix: "בדמשק" (in Damascus) 
@@ -436,31 +510,32 @@ def extract_location_context(text: str, location_name: str, context_window: int
     # 3. Full name with country: "דמשק (סוריה)"
     
     search_variants = [
-        r'ב' + re.escape(location_base),  # With ב (in)
-        re.escape(location_base),         # Base name
+        'ב' + location_base,  # With ב (in)
+        location_base,        # Base name
     ]
     
     # If full name differs from base, add it too
     if location_base != location_name:
-        search_variants.append(re.escape(location_name))
+        search_variants.append(location_name)
     
-    match = None
+    span = None
     for variant in search_variants:
-        match = re.search(variant, text, re.IGNORECASE)
-        if match:
+        span = _find_ignorecase(text, variant)
+        if span:
             break
     
-    if not match:
+    if not span:
         # Location not found in text - might be false positive from Kima
         # Return empty string to signal no context available
         return ""
     
-    start = max(0, match.start() - context_window)
-    end = min(len(text), match.end() + context_window)
+    start = max(0, span[0] - context_window)
+    end = min(len(text), span[1] + context_window)
     
     return text[start:end]
 
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
 def classify_location_by_patterns(
     text: str,
     location_name: str
@@ -470,6 +545,8 @@ def classify_location_by_patterns(
     
     IMPROVED: Uses context-aware heuristics as fallback when explicit patterns don't match
     
+    Memoized on (text, location_name); the result depends on nothing else.
+    
     Args:
         text: Full catalog note text
         location_name: Location name to classify
@@ -482,21 +559,20 @@ def classify_location_by_patterns(
     
     # If location not found in text (false positive from Kima), skip it
     # Don't send to Grok - it's likely not a real location mention
-    if not context or not context.strip():
+    if not context or context.isspace():
         return None
     
     # Try each pattern in order of precedence
-    for pattern_def in ALL_LOCATION_PATTERNS:
-        for pattern in pattern_def.patterns:
-            if re.search(pattern, context, re.IGNORECASE):
-                return pattern_def.role
+    for role, pattern in _LOCATION_ROLE_PATTERNS:
+        if pattern.search(context):
+            return role
     
     # ========== NO EXPLICIT PATTERN MATCHED - USE CONTEXT HEURISTICS ==========
     # This is where we improve from 55% to 80%+ accuracy
     
     # HEURISTIC 1: Check section-based context
     # Look at larger text section to determine context
-    location_pos = text.find(extract_location_context(text, location_name))
+    location_pos = text.find(context)
     if location_pos == -1:
         location_pos = 0
     
@@ -506,28 +582,28 @@ def classify_location_by_patterns(
     broader_context = text_before + text_after
     
     # Check for colophon context → production place
-    if re.search(r'קולופון|נשלם\s+(?:בעיר)?|הועתק|נכתב(?:\s+בעיר)?', broader_context, re.IGNORECASE):
+    if _COLOPHON_CONTEXT.search(broader_context):
         return "production place"
     
     # Check for preservation/ownership context → preserved in
-    if re.search(r'ספריית|באוסף|בעלות|בידי|נמצא\s+ב|שמור\s+ב|repository|archive', broader_context, re.IGNORECASE):
+    if _PRESERVATION_CONTEXT.search(broader_context):
         return "preserved in"
     
     # Check for provenance context → transferred to/from
-    if re.search(r'מאוסף|לפנים|בעבר|מיד|הועבר|נמכר|לקוח', broader_context, re.IGNORECASE):
+    if _PROVENANCE_CONTEXT.search(broader_context):
         return "transferred to"
     
     # Check for person context → resided in / active in
-    if re.search(r'גר\s+ב|ישב\s+ב|דר\s+ב|מושבו|עיר|חי\s+ב', broader_context, re.IGNORECASE):
+    if _RESIDENCE_CONTEXT.search(broader_context):
         return "resided in"
     
     # HEURISTIC 2: Format clues in the immediate context
     # Multiple locations separated by commas/semicolons → likely transfers or ownership
-    if re.search(r'[,;]\s*(?:ו)?(?:ג)?[אב-ת]', context):
+    if _LIST_SEPARATOR.search(context):
         return "transferred to"
     
     # HEURISTIC 3: Subject/topic field markers
-    if re.search(r'נושא|subject|subject matter|תחום', broader_context, re.IGNORECASE):
+    if _SUBJECT_CONTEXT.search(broader_context):
         # Location mentioned as subject (e.g., "customs of Yemen") → active in / origin
         return "active in"
     
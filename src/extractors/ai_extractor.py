@@ -6,7 +6,7 @@ Complete extraction without regex patterns - AI extracts all entities directly
 import json
 import time
 import requests
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from functools import lru_cache
 
 from ..models.entities import (
@@ -129,7 +129,7 @@ class GrokAIExtractor:
         Returns:
             Dictionary with extracted entities
         """
-        if not text or not text.strip():
+        if not text or text.isspace():
             return self._empty_response()
         
         prompt = EXTRACTION_USER_PROMPT_TEMPLATE.format(text=text)
@@ -498,25 +498,22 @@ def ai_response_to_manuscript(
 # BATCH PROCESSING
 # ============================================================================
 
-def extract_batch_with_ai(
-    texts: List[Tuple[str, str, Dict]],  # (text, ms_id, metadata)
+def iter_extract_with_ai(
+    texts: Iterable[Tuple[str, str, Dict]],  # (text, ms_id, metadata)
     extractor: GrokAIExtractor,
     show_progress: bool = True
-) -> Tuple[List[Manuscript], Dict[str, List]]:
+) -> Iterator[Tuple[Manuscript, List]]:
     """
-    Extract entities from multiple texts using AI
+    Extract entities from multiple texts using AI, one manuscript at a time
     
     Args:
-        texts: List of (text, manuscript_id, metadata) tuples
+        texts: (text, manuscript_id, metadata) tuples
         extractor: GrokAIExtractor instance
         show_progress: Show progress bar
         
-    Returns:
-        Tuple of (List of Manuscript objects, Dict mapping manuscript_id to ClassifiedEntity list)
+    Yields:
+        (Manuscript, its classified entities) per input text, in input order
     """
-    manuscripts = []
-    classified_map = {}
-    
     if show_progress:
         try:
             from tqdm import tqdm
@@ -531,21 +528,42 @@ def extract_batch_with_ai(
         ai_data = extractor.extract_from_text(text, ms_id)
         
         # Convert to Manuscript object and get classified entities
-        manuscript, classified_entities = ai_response_to_manuscript(
+        yield ai_response_to_manuscript(
             ai_data=ai_data,
             text=text,
             manuscript_id=ms_id,
             source_metadata=metadata
         )
         
+        # Rate limiting - small delay between requests
+        time.sleep(0.2)
+
+
+def extract_batch_with_ai(
+    texts: List[Tuple[str, str, Dict]],  # (text, ms_id, metadata)
+    extractor: GrokAIExtractor,
+    show_progress: bool = True
+) -> Tuple[List[Manuscript], Dict[str, List]]:
+    """
+    Extract entities from multiple texts using AI
+    
+    Args:
+        texts: List of (text, manuscript_id, metadata) tuples
+        extractor: GrokAIExtractor instance
+        show_progress: Show progress bar
+        
+    Returns:
+        Tuple of (List of Manuscript objects, Dict mapping manuscript_id to ClassifiedEntity list)
+    """
+    manuscripts = []
+    classified_map = {}
+    
+    for manuscript, classified_entities in iter_extract_with_ai(texts, extractor, show_progress):
         manuscripts.append(manuscript)
         
         # Store classified entities for this manuscript
         if classified_entities:
-            classified_map[ms_id] = classified_entities
-        
-        # Rate limiting - small delay between requests
-        time.sleep(0.2)
+            classified_map[manuscript.manuscript_id] = classified_entities
     
     return manuscripts, classified_map
 
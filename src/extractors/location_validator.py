@@ -7,21 +7,23 @@ but are actually dates, person names, or common words.
 """
 
 import re
-from typing import Optional, Set
+import sys
+from typing import Optional, Pattern, Set
 
 # ============================================================================
 # HEBREW BLACKLIST - Words that should NEVER be treated as locations
 # ============================================================================
 
-# Hebrew months (absolute blacklist - these are NEVER locations in our context)
-HEBREW_MONTHS = frozenset([
+# Hebrew months (absolute blacklist - these are NEVER locations in our context).
+# Blacklist strings are interned so probes with interned tokens compare by identity.
+HEBREW_MONTHS = frozenset(map(sys.intern, [
     "ניסן", "אייר", "סיון", "תמוז", "אב", "אלול",
     "תשרי", "חשון", "כסלו", "טבת", "שבט", "אדר",
     "אדר א", "אדר ב", "ירח"  # ירח = month (generic)
-])
+]))
 
 # Common Hebrew words that happen to match place names
-COMMON_HEBREW_WORDS = frozenset([
+COMMON_HEBREW_WORDS = frozenset(map(sys.intern, [
     # Pronouns and particles
     "אני", "או", "אן", "אם", "בר", "מר", "נר",
     
@@ -55,7 +57,7 @@ COMMON_HEBREW_WORDS = frozenset([
     "א", "ב", "ג", "ד", "ה", "ו", "ז", "ח", "ט", "י",
     "אב", "אג", "אד", "אה", "אז", "או", "אי", "בא",
     "בה", "בו", "גב", "דב", "הב", "וב", "זב",
-])
+]))
 
 # Phrases that indicate NON-location context
 NON_LOCATION_CONTEXTS = frozenset([
@@ -117,6 +119,70 @@ LOCATION_CONTEXT_INDICATORS = frozenset([
 ])
 
 
+# Nikud (vowel points) and cantillation marks, removed before blacklist checks
+_NIKUD_RE = re.compile(r'[\u0591-\u05C7]')
+_NIKUD_TABLE = dict.fromkeys(range(0x0591, 0x05C8))
+
+# Phrases that indicate a person name around the candidate
+PERSON_NAME_INDICATORS = (
+    r'בן\s+\w+', r'בר\s+\w+', r'בת\s+\w+',
+    r'רבי\s+\w+', r'הרב\s+\w+', r'ר\'\s*\w+',
+    r'מאת\s+\w+', r'אמר\s+\w+', r'כתב\s+\w+',
+    r'\w+\s+בן\s+', r'\w+\s+בר\s+',
+)
+
+
+def _fuse_patterns(patterns) -> Pattern:
+    """Compile patterns into one alternation: any-match in a single scan"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+# Each context family fused into one alternation (one scan per context window)
+_LOCATION_CONTEXT_RE = _fuse_patterns(LOCATION_CONTEXT_INDICATORS)
+_NON_LOCATION_CONTEXT_RE = _fuse_patterns(NON_LOCATION_CONTEXTS)
+_PERSON_NAME_CONTEXT_RE = _fuse_patterns(PERSON_NAME_INDICATORS)
+
+# Common first name followed by a patronymic marker (בן/בר/בת)
+_PERSON_NAME_RE = re.compile(
+    r'(?:יוסף|משה|דוד|יעקב|שמואל|עזרא|שלמה|יהודה|אברהם|אלעזר|יצחק|לוי|בנימין)\s+(?:בן|בר|בת)\s+\w+'
+)
+
+# Country suffix in parentheses, e.g. "דמשק (סוריה)"
+_COUNTRY_SUFFIX_RE = re.compile(r'\s*\([^)]+\)\s*$')
+_HEBREW_COUNTRY_SUFFIX_RE = re.compile(r'\s*\([א-ת\s,]+\)\s*$')
+
+
+_is_word_char = re.compile(r'\w').match
+
+
+def _find_word(text: str, word: str) -> int:
+    """
+    Position of the first whole-word occurrence of word in text, or -1
+    
+    Same result as re.search(r'\b' + re.escape(word) + r'\b', text), but
+    candidates come from str.find instead of the regex engine.
+    """
+    if not word:
+        match = re.search(r'\b', text)
+        return match.start() if match else -1
+    
+    starts_with_word_char = bool(_is_word_char(word[0]))
+    ends_with_word_char = bool(_is_word_char(word[-1]))
+    text_length = len(text)
+    
+    position = text.find(word)
+    while position != -1:
+        end = position + len(word)
+        # \b holds where word-char-ness differs across the boundary
+        before_is_word = position > 0 and bool(_is_word_char(text[position - 1]))
+        after_is_word = end < text_length and bool(_is_word_char(text[end]))
+        if before_is_word != starts_with_word_char and after_is_word != ends_with_word_char:
+            return position
+        position = text.find(word, position + 1)
+    
+    return -1
+
+
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
@@ -131,10 +197,11 @@ def is_blacklisted(word: str) -> bool:
     Returns:
         True if word is blacklisted
     """
-    word_clean = word.strip()
+    word_no_nikud = word.strip()
     
-    # Remove nikud (vowel points) for comparison
-    word_no_nikud = re.sub(r'[\u0591-\u05C7]', '', word_clean)
+    # Remove nikud (vowel points) for comparison - most catalog text has none
+    if _NIKUD_RE.search(word_no_nikud):
+        word_no_nikud = word_no_nikud.translate(_NIKUD_TABLE)
     
     return (
         word_no_nikud in HEBREW_MONTHS or
@@ -159,11 +226,7 @@ def is_in_date_context(text: str, position: int, window: int = 50) -> bool:
     end = min(len(text), position + window)
     context = text[start:end]
     
-    for pattern in NON_LOCATION_CONTEXTS:
-        if re.search(pattern, context):
-            return True
-    
-    return False
+    return _NON_LOCATION_CONTEXT_RE.search(context) is not None
 
 
 def is_in_person_name_context(text: str, position: int, window: int = 30) -> bool:
@@ -183,18 +246,7 @@ def is_in_person_name_context(text: str, position: int, window: int = 30) -> boo
     context = text[start:end]
     
     # Check for person name indicators
-    person_indicators = [
-        r'בן\s+\w+', r'בר\s+\w+', r'בת\s+\w+',
-        r'רבי\s+\w+', r'הרב\s+\w+', r'ר\'\s*\w+',
-        r'מאת\s+\w+', r'אמר\s+\w+', r'כתב\s+\w+',
-        r'\w+\s+בן\s+', r'\w+\s+בר\s+',
-    ]
-    
-    for pattern in person_indicators:
-        if re.search(pattern, context):
-            return True
-    
-    return False
+    return _PERSON_NAME_CONTEXT_RE.search(context) is not None
 
 
 def has_location_context_indicator(text: str, word: str, window: int = 100) -> bool:
@@ -211,20 +263,12 @@ def has_location_context_indicator(text: str, word: str, window: int = 100) -> b
     """
     # Find word position
     # Clean word - remove country suffix in parentheses if present
-    word_base = re.sub(r'\s*\([^)]+\)\s*$', '', word).strip()
-    
-    # Try multiple search patterns
-    search_patterns = [
-        r'ב' + re.escape(word_base),  # With ב prefix
-        r'\b' + re.escape(word_base) + r'\b',  # Exact word
-    ]
-    
-    position = -1
-    for pattern in search_patterns:
-        match = re.search(pattern, text)
-        if match:
-            position = match.start()
-            break
+    word_base = _COUNTRY_SUFFIX_RE.sub('', word).strip()
+    
+    # Try multiple search patterns: with ב prefix first, then the exact word
+    position = text.find('ב' + word_base)
+    if position == -1:
+        position = _find_word(text, word_base)
     
     if position == -1:
         return False  # Word not found
@@ -235,12 +279,11 @@ def has_location_context_indicator(text: str, word: str, window: int = 100) -> b
     context = text[start:end]
     
     # Look for location indicators
-    for indicator in LOCATION_CONTEXT_INDICATORS:
-        if re.search(indicator, context):
-            return True
+    if _LOCATION_CONTEXT_RE.search(context):
+        return True
     
     # Check if word has country suffix (strong location indicator)
-    if re.search(r'\s*\([א-ת\s,]+\)\s*$', word):
+    if _HEBREW_COUNTRY_SUFFIX_RE.search(word):
         return True
     
     return False
@@ -267,7 +310,7 @@ def validate_location_extraction(
     word_clean = word.strip()
     
     # Remove country suffix for analysis
-    word_base = re.sub(r'\s*\([^)]+\)\s*$', '', word_clean).strip()
+    word_base = _COUNTRY_SUFFIX_RE.sub('', word_clean).strip()
     
     # Rule 1: Check blacklist (absolute veto)
     if is_blacklisted(word_base):
@@ -277,20 +320,15 @@ def validate_location_extraction(
     if len(word_base) < min_length:
         return False
     
-    # Rule 3: Find word position in text
-    word_escaped = re.escape(word_base)
-    match = re.search(r'\b' + word_escaped + r'\b', text)
-    
-    if not match:
-        # Try with ב prefix
-        match = re.search(r'ב' + word_escaped, text)
+    # Rule 3: Find word position in text (exact word first, then with ב prefix)
+    position = _find_word(text, word_base)
+    if position == -1:
+        position = text.find('ב' + word_base)
     
-    if not match:
+    if position == -1:
         # Word not in text (might be from MARC field) - allow but with caution
         # Only accept if word has country suffix (structured data indicator)
-        return bool(re.search(r'\s*\([^)]+\)\s*$', word_clean))
-    
-    position = match.start()
+        return bool(_COUNTRY_SUFFIX_RE.search(word_clean))
     
     # Rule 4: Check for disqualifying contexts
     if is_in_date_context(text, position):
@@ -339,15 +377,18 @@ def get_location_confidence(word: str, text: str) -> float:
     # CHECK FOR PERSON NAME FALSE POSITIVES
     # Pattern: "Name [בן|בר|בת] Patronymic"
     # If we see שם בן/בר pattern near our location, likely a person name match
-    person_name_pattern = r'(?:יוסף|משה|דוד|יעקב|שמואל|עזרא|שלמה|יהודה|אברהם|אלעזר|יצחק|לוי|בנימין)\s+(?:בן|בר|בת)\s+\w+'
-    if re.search(person_name_pattern, text, re.IGNORECASE):
-        # Check if our word appears near a known person name
-        for match in re.finditer(person_name_pattern, text, re.IGNORECASE):
-            person_context = text[max(0, match.start()-30):match.end()+30]
-            if word_base.lower() in person_context.lower():
-                # Word appears in person name context - likely false positive!
-                confidence *= 0.2  # Massive penalty
-                break
+    # Hebrew has no case: only fold when the word has cased (e.g. Latin) letters
+    fold_case = word_base.lower() != word_base.upper()
+    word_key = word_base.lower() if fold_case else word_base
+    # Check if our word appears near a known person name
+    for match in _PERSON_NAME_RE.finditer(text):
+        person_context = text[max(0, match.start()-30):match.end()+30]
+        if fold_case:
+            person_context = person_context.lower()
+        if word_key in person_context:
+            # Word appears in person name context - likely false positive!
+            confidence *= 0.2  # Massive penalty
+            break
     
     # PENALIZE if in date context
     if is_in_date_context(text, text.find(word_base)):
@@ -4,7 +4,8 @@ All functions are pure - no side effects, deterministic output
 """
 
 import re
-from typing import List, Tuple, Optional, Set
+import sys
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from functools import lru_cache
 
 from ..models.entities import ExtractedEntity, EntityType, ColophonInfo, Person
@@ -25,18 +26,26 @@ RE_CENTURY_DIGIT = r"(?:ה?מאה\s+ה?)(1[4-9]|20)(?!\s*\d)"
 RE_YEAR_RANGE = rf"{RE_YEAR}\s*(?:-|–|—|/|\\)\s*{RE_YEAR}"
 
 DATE_REGEXES = [
-    ("year_range", re.compile(RE_YEAR_RANGE, re.IGNORECASE)),
-    ("gregorian_year", re.compile(RE_YEAR, re.IGNORECASE)),
+    ("year_range", re.compile(RE_YEAR_RANGE)),
+    ("gregorian_year", re.compile(RE_YEAR)),
     ("century_digit", re.compile(RE_CENTURY_DIGIT)),
 ]
 
-HEBREW_MONTHS = frozenset([
+# All date patterns in one alternation: a single scan of the text,
+# dispatched on the named group that matched
+DATE_COMBINED_REGEX = re.compile(
+    "|".join(f"(?P<{name}>{regex.pattern})" for name, regex in DATE_REGEXES)
+)
+_YEAR_REGEX = dict(DATE_REGEXES)["gregorian_year"]
+
+# Constants and tokens are interned so set probes short-circuit on identity
+HEBREW_MONTHS = frozenset(map(sys.intern, [
     "תשרי", "חשון", "כסלו", "טבת", "שבט", "אדר", "ניסן", 
     "אייר", "סיון", "תמוז", "אב", "אלול", "מרחשון"
-])
+]))
 
 # Common Hebrew words that are NOT locations (blacklist)
-LOCATION_BLACKLIST = frozenset([
+LOCATION_BLACKLIST = frozenset(map(sys.intern, [
     # Compound prefixes that should never appear alone
     "תל",      # Always "תל אביב", never alone
     "בית",     # Usually "בית שאן", "בית לחם"
@@ -59,7 +68,18 @@ LOCATION_BLACKLIST = frozenset([
     
     # Hebrew months (duplicate check - already in HEBREW_MONTHS but add here too)
     "אייר",                     # Hebrew month, not a place
-])
+]))
+
+# Hebrew unicode range pattern (include hyphens for compound names like תל אביב-יפו).
+# Only whole runs that neither start nor end with a hyphen are tokens.
+_HEB_TOKEN_RE = re.compile(
+    r'(?<![\u0590-\u05FF\-])'
+    r'[\u0590-\u05FF](?:[\u0590-\u05FF\-]*[\u0590-\u05FF])?'
+    r'(?![\u0590-\u05FF\-])'
+)
+
+# Sentinel for per-text gazetteer memos (None is a valid "not found" result)
+_NOT_LOOKED_UP = object()
 
 
 @lru_cache(maxsize=1000)
@@ -82,15 +102,28 @@ def extract_dates(text: str) -> List[ExtractedEntity]:
     Returns:
         List of immutable ExtractedEntity objects
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return []
     
     found_dates: List[ExtractedEntity] = []
     seen_values: Set[str] = set()
     
-    for pattern_name, regex in DATE_REGEXES:
-        for match in regex.finditer(text):
-            value = match.group().strip()
+    # Bucket matches by pattern so results keep the DATE_REGEXES order
+    matches_by_pattern = {pattern_name: [] for pattern_name, _ in DATE_REGEXES}
+    for match in DATE_COMBINED_REGEX.finditer(text):
+        pattern_name = match.lastgroup
+        matches_by_pattern[pattern_name].append(match)
+        if pattern_name == "year_range":
+            # The alternation consumes the range; its years are dates too
+            matches_by_pattern["gregorian_year"].extend(
+                _YEAR_REGEX.finditer(text, match.start(), match.end())
+            )
+    
+    for pattern_name, matches in matches_by_pattern.items():
+        for match in matches:
+            # Interned: the same dates recur across manuscripts and key the
+            # export's classification and source-field lookups
+            value = sys.intern(match.group().strip())
             
             # Skip if already found
             if value in seen_values:
@@ -125,6 +158,19 @@ def load_gazetteer(gazetteer_set: Set[str]) -> frozenset:
     return frozenset(gazetteer_set)
 
 
+@lru_cache(maxsize=8)
+def gazetteer_phrase_lengths(gazetteer: frozenset) -> frozenset:
+    """
+    Pure function: Token counts that occur among gazetteer entries
+    
+    Phrases are built by joining tokens with single spaces, so an entry can
+    only match a phrase with the same number of spaces.
+    """
+    return frozenset(
+        name.count(" ") + 1 for name in gazetteer if isinstance(name, str)
+    )
+
+
 def extract_locations(
     text: str, 
     gazetteer: frozenset = frozenset(),
@@ -143,25 +189,24 @@ def extract_locations(
     Returns:
         List of immutable ExtractedEntity objects
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return []
     
-    # Hebrew unicode range pattern (include hyphens for compound names like תל אביב-יפו)
-    HEB_PATTERN = r'[\u0590-\u05FF\-]+'
-    
     # Tokenize and clean up
-    raw_tokens = re.findall(HEB_PATTERN, text)
-    # Remove tokens that are just hyphens
-    tokens = [t for t in raw_tokens if t != '-' and not t.startswith('-') and not t.endswith('-')]
+    tokens = _tokenize_hebrew(text)
     locations: List[ExtractedEntity] = []
     seen_values: Set[str] = set()
     
     # FIRST: Extract multi-token phrases (higher priority than single words)
     multi_word_tokens = set()  # Track tokens that are part of multi-word phrases
     
+    # Skip phrase lengths that no gazetteer entry has
+    phrase_lengths = gazetteer_phrase_lengths(gazetteer)
+    
     for n in range(max_tokens, 1, -1):  # Start with longest phrases
-        for i in range(len(tokens) - n + 1):
-            phrase = " ".join(tokens[i:i+n])
+        if n not in phrase_lengths:
+            continue
+        for i, phrase in enumerate(_ngrams(tokens, n)):
             
             # Check original phrase
             if phrase in gazetteer and phrase not in seen_values:
@@ -181,7 +226,7 @@ def extract_locations(
                 first_token = tokens[i]
                 stripped_first = _strip_hebrew_prefixes(first_token)
                 if stripped_first != first_token:
-                    stripped_phrase = " ".join([stripped_first] + tokens[i+1:i+n])
+                    stripped_phrase = stripped_first + phrase[len(first_token):]
                     if stripped_phrase in gazetteer and stripped_phrase not in seen_values:
                         entity = ExtractedEntity(
                             value=stripped_phrase,
@@ -252,24 +297,39 @@ def extract_locations(
     return locations
 
 
+def _tokenize_hebrew(text: str) -> List[str]:
+    """Pure helper: Split text into Hebrew tokens, dropping dangling hyphens"""
+    # Interned: common words recur across manuscripts and hit interned sets
+    return list(map(sys.intern, _HEB_TOKEN_RE.findall(text)))
+
+
+def _ngrams(tokens: List[str], n: int) -> Iterator[str]:
+    """
+    Pure helper: All space-joined windows of n consecutive tokens, in order
+    
+    Windows are built by zip/map rather than per-index slicing and joining,
+    keeping the n-gram scan inside C-level builtins.
+    """
+    return map(" ".join, zip(*[tokens[k:] for k in range(n)]))
+
+
+# Hebrew prefixes: ב (in), ל (to), מ (from), ה (the), ו (and), כ (like), ש (that)
+_HEB_PREFIXES = frozenset("בלמהוכש")
+
+
+@lru_cache(maxsize=8192)
 def _strip_hebrew_prefixes(token: str) -> str:
     """
     Pure helper: Strip Hebrew prefixes from token
     
     Hebrew prefixes: ב (in), ל (to), מ (from), ה (the), ו (and), כ (like), ש (that)
     """
-    prefixes = ['ב', 'ל', 'מ', 'ה', 'ו', 'כ', 'ש']
-    
-    for prefix in prefixes:
-        # Require at least 2 characters after prefix (e.g., בתל → תל is OK)
-        if token.startswith(prefix) and len(token) > len(prefix) + 1:
-            # Check if next character is also a prefix (e.g., "וב", "מה")
-            remaining = token[1:]
-            if len(remaining) > 1 and remaining[0] in prefixes:
-                # Double prefix case (e.g., "מה", "וב")
-                if len(remaining) > 2:
-                    return remaining[1:]  # Strip both prefixes
-            return remaining
+    # Require at least 2 characters after prefix (e.g., בתל → תל is OK)
+    if len(token) > 2 and token[0] in _HEB_PREFIXES:
+        # Double prefix case (e.g., "מה", "וב") - strip both prefixes
+        if len(token) > 3 and token[1] in _HEB_PREFIXES:
+            return token[2:]
+        return token[1:]
     
     return token
 
@@ -299,7 +359,7 @@ def extract_locations_with_kima(
     Returns:
         List of immutable ExtractedEntity objects with rich metadata
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return []
     
     # Import validators
@@ -309,33 +369,39 @@ def extract_locations_with_kima(
         is_blacklisted
     )
     
-    # Hebrew unicode range pattern (include hyphens for compound names)
-    HEB_PATTERN = r'[\u0590-\u05FF\-]+'
-    
     # Tokenize and clean up
-    raw_tokens = re.findall(HEB_PATTERN, text)
-    # Remove tokens that are just hyphens
-    tokens = [t for t in raw_tokens if t != '-' and not t.startswith('-') and not t.endswith('-')]
+    tokens = _tokenize_hebrew(text)
     
     locations: List[ExtractedEntity] = []
     seen_values: Set[str] = set()
     
+    # Per-text memo: the same tokens and phrases recur across (n, i) windows
+    blacklisted_tokens: Dict[str, bool] = {}
+    lookup_results: Dict[str, Optional[dict]] = {}
+    
     # Try multi-token phrases first (up to 6 tokens)
     max_tokens = 6
+    phrase_lengths = kima_gazetteer.phrase_lengths
     for n in range(max_tokens, 0, -1):  # Start with longest phrases
-        for i in range(len(tokens) - n + 1):
-            phrase = " ".join(tokens[i:i+n])
+        if n not in phrase_lengths:
+            continue  # No gazetteer entry has this many tokens
+        for i, phrase in enumerate(_ngrams(tokens, n)):
             
             # PRE-FILTER: Check if SOURCE PHRASE is blacklisted BEFORE Kima lookup
             # This prevents common words like "נושא" (subject) from being looked up
-            phrase_base = phrase.split()[0] if ' ' in phrase else phrase
+            phrase_base = tokens[i]
             
-            if is_blacklisted(phrase_base):
+            blacklisted = blacklisted_tokens.get(phrase_base)
+            if blacklisted is None:
+                blacklisted = blacklisted_tokens[phrase_base] = is_blacklisted(phrase_base)
+            if blacklisted:
                 # Skip blacklisted source words
                 continue
             
             # Try Kima lookup (includes variants, forms, and prefix stripping)
-            place_data = kima_gazetteer.lookup(phrase)
+            place_data = lookup_results.get(phrase, _NOT_LOOKED_UP)
+            if place_data is _NOT_LOOKED_UP:
+                place_data = lookup_results[phrase] = kima_gazetteer.lookup(phrase)
             
             if place_data and place_data['hebrew'] not in seen_values:
                 canonical_name = place_data['hebrew']
@@ -421,11 +487,11 @@ def detect_colophon(text: str) -> bool:
     Returns:
         Boolean indicating colophon presence
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return False
     
-    return any(re.search(marker, text, re.IGNORECASE) 
-               for marker in COLOPHON_MARKERS)
+    # Markers are Hebrew-only (no case), so no IGNORECASE needed
+    return any(re.search(marker, text) for marker in COLOPHON_MARKERS)
 
 
 def extract_colophon_info(text: str) -> Optional[ColophonInfo]:
@@ -441,7 +507,7 @@ def extract_colophon_info(text: str) -> Optional[ColophonInfo]:
     if not detect_colophon(text):
         return None
     
-    has_completion = any(re.search(pattern, text, re.IGNORECASE)
+    has_completion = any(re.search(pattern, text)
                         for pattern in COMPLETION_PATTERNS)
     
     scribe_name = extract_scribe_name(text)
@@ -492,6 +558,10 @@ def extract_scribe_name(text: str) -> Optional[str]:
     return None
 
 
+# Pattern: X ben Y (Hebrew patronymic)
+_PERSON_MENTION_RE = re.compile(r"([\u0590-\u05FF]{2,})\s+בן\s+([\u0590-\u05FF]{2,})")
+
+
 def extract_person_mentions(text: str) -> List[Person]:
     """
     Pure function: Extract all person mentions from text
@@ -502,34 +572,29 @@ def extract_person_mentions(text: str) -> List[Person]:
     Returns:
         List of immutable Person objects
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return []
     
-    persons: List[Person] = []
-    seen_names: Set[str] = set()
-    
-    # Pattern: X ben Y (Hebrew patronymic)
-    pattern = r"([\u0590-\u05FF]{2,})\s+בן\s+([\u0590-\u05FF]{2,})"
+    return list(_iter_person_mentions(text))
+
+
+def _iter_person_mentions(text: str) -> Iterator[Person]:
+    """Pure helper: Lazily yield unique X-ben-Y persons in text order"""
+    seen_names: Set[Tuple[str, str]] = set()
     
-    for match in re.finditer(pattern, text):
+    for match in _PERSON_MENTION_RE.finditer(text):
         first_name = _normalize_hebrew_name(match.group(1))
         father_name = _normalize_hebrew_name(match.group(2))
-        full_name = f"{first_name} בן {father_name}"
+        key = (first_name, father_name)
         
-        if full_name not in seen_names:
-            person = Person(
-                name=first_name,
-                patronymic=father_name
-            )
-            persons.append(person)
-            seen_names.add(full_name)
-    
-    return persons
+        if key not in seen_names:
+            seen_names.add(key)
+            yield Person(name=first_name, patronymic=father_name)
 
 
 def _normalize_hebrew_name(name: str) -> str:
-    """Pure helper: Normalize Hebrew name text"""
-    return re.sub(r'\s+', ' ', name.strip())
+    """Pure helper: Normalize Hebrew name text (interned; names recur across manuscripts)"""
+    return sys.intern(re.sub(r'\s+', ' ', name.strip()))
 
 
 # ============================================================================
@@ -553,7 +618,7 @@ def extract_work_title(text: str) -> Optional[str]:
     Returns:
         Title string or None
     """
-    if not isinstance(text, str) or not text.strip():
+    if not isinstance(text, str) or not text or text.isspace():
         return None
     
     for pattern in TITLE_PATTERNS:
@@ -3,11 +3,34 @@ Data I/O Module - Isolated Side Effects
 Handles all file operations (reading/writing)
 """
 
+import csv
+import sys
+import unicodedata
 import pandas as pd
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, FrozenSet, Hashable, Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 
-from ..models.entities import Manuscript, ExtractionResult, ExtractedEntity, ClassifiedEntity, EntityType
+from ..models.entities import Manuscript, ExtractionResult, ExtractedEntity, ClassifiedEntity, EntityType, EventClass
+
+# Optional fast parsers, used when installed: calamine (Rust) for Excel
+# (pandas >= 2.2) and pyarrow for CSV; otherwise pandas' defaults
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine" if tuple(map(int, pd.__version__.split(".")[:2])) >= (2, 2) else None
+except ImportError:
+    EXCEL_ENGINE = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    pyarrow = pq = None
+    CSV_ENGINE = None
 
 
 # ============================================================================
@@ -16,31 +39,44 @@ from ..models.entities import Manuscript, ExtractionResult, ExtractedEntity, Cla
 
 # Define which fields are "note" fields (where new data is found)
 # vs structured MARC fields (where data already exists)
-NOTE_FIELDS = frozenset([
+# ('$' keeps these literals out of CPython's automatic interning, so field
+# codes are interned explicitly to share one object with the loaded columns)
+NOTE_FIELDS = frozenset(map(sys.intern, [
     "957$a",  # Summary/abstract (Hebrew)
     "500$a",  # General notes
     "561$a",  # Provenance notes
-])
+]))
 
 # Structured MARC fields (non-note fields)
-STRUCTURED_DATE_FIELDS = frozenset([
+STRUCTURED_DATE_FIELDS = frozenset(map(sys.intern, [
     "046$a", "046$b", "046$d", "260$c", "264$c", "008"
-])
+]))
 
-STRUCTURED_LOCATION_FIELDS = frozenset([
+STRUCTURED_LOCATION_FIELDS = frozenset(map(sys.intern, [
     "651$a", "751$a", "260$a", "264$a", "034$a"
-])
+]))
 
-STRUCTURED_PERSON_FIELDS = frozenset([
+STRUCTURED_PERSON_FIELDS = frozenset(map(sys.intern, [
     "100$a", "600$a", "700$a", "710$a", "100$e", "700$e"
-])
+]))
+
+# Field values up to this length are interned (recurring names, places, dates)
+INTERN_MAX_LENGTH = 64
+
+# Parsed workbooks are cached beside the source file as Parquet (needs
+# pyarrow); the workbook's size and mtime are stored in the cache and must
+# match exactly for it to be reused
+PARSE_CACHE_SUFFIX = ".cache.parquet"
+PARSE_CACHE_STAT_KEY = b"workbook_stat"
 
 
 def load_excel_data(
     filepath: str,
     id_column: str = "001",
     notes_columns: List[str] = None,
-    passthrough_columns: Optional[List[str]] = None
+    passthrough_columns: Optional[List[str]] = None,
+    use_cache: bool = True,
+    max_manuscripts: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Load manuscript data from Excel file
@@ -50,9 +86,13 @@ def load_excel_data(
         id_column: Column containing manuscript IDs
         notes_columns: List of columns containing notes text (will be combined)
         passthrough_columns: Additional columns to preserve
+        use_cache: Reuse/refresh the parsed-sheet cache next to the workbook
+        max_manuscripts: Keep only the first this many manuscripts; without a
+            parse cache, only the leading rows of the sheet are read (and the
+            partial sheet is not cached)
         
     Returns:
-        DataFrame with manuscript data (includes 'combined_notes' column and field maps)
+        DataFrame with manuscript data (includes 'combined_notes' column)
     """
     if notes_columns is None:
         # Expanded to include fields where locations/persons/dates appear
@@ -75,10 +115,47 @@ def load_excel_data(
             "710$e",  # Relator term (role of organization)
         ]
     
-    try:
-        df = pd.read_excel(filepath)
-    except Exception as e:
-        raise IOError(f"Failed to load Excel file: {e}")
+    # With explicit passthrough columns, keep only what extraction and
+    # source-field tracking need; otherwise every column is carried through
+    wanted = None
+    if passthrough_columns is not None:
+        wanted = frozenset([
+            id_column, *notes_columns, *passthrough_columns,
+            *STRUCTURED_DATE_FIELDS, *STRUCTURED_LOCATION_FIELDS, *STRUCTURED_PERSON_FIELDS,
+        ])
+    
+    df = _read_excel_cached(filepath) if use_cache else None
+    if df is None:
+        # Rows without notes are dropped below, so a limited read grows until
+        # it holds enough manuscripts or reaches the end of the sheet
+        nrows = max_manuscripts or None
+        try:
+            while True:
+                df = pd.read_excel(
+                    filepath,
+                    usecols=None if wanted is None else wanted.__contains__,
+                    nrows=nrows,
+                    engine=EXCEL_ENGINE
+                )
+                if nrows is None or len(df) < nrows or _count_with_notes(df, notes_columns) >= max_manuscripts:
+                    break
+                nrows *= 2
+        except Exception as e:
+            raise IOError(f"Failed to load Excel file: {e}")
+        # Only full sheets are cached, so any later column subset can reuse them
+        if use_cache and wanted is None and nrows is None:
+            _write_parse_cache(df, filepath)
+    elif wanted is not None:
+        df = df[[col for col in df.columns if col in wanted]]
+    
+    # Field codes recur as keys of every row's metadata
+    df.columns = [sys.intern(col) if isinstance(col, str) else col for col in df.columns]
+    
+    # Canonical (NFC) text, so extracted entities and field values compare
+    # equal regardless of how combining marks were encoded in the sheet
+    for col in df.columns:
+        if df[col].dtype.kind == "O" or isinstance(df[col].dtype, pd.StringDtype):
+            df[col] = df[col].map(_to_nfc, na_action='ignore')
     
     # Validate required columns
     if id_column not in df.columns:
@@ -91,36 +168,170 @@ def load_excel_data(
     
     print(f"  Note fields found: {', '.join(existing_notes_columns)}")
     
-    # Combine notes from all available columns
-    def combine_notes(row):
-        """Combine text from multiple note fields"""
-        parts = []
-        for col in existing_notes_columns:
-            value = row.get(col, "")
-            if pd.notna(value) and str(value).strip():
-                parts.append(str(value).strip())
-        return " | ".join(parts) if parts else ""
-    
-    df['combined_notes'] = df.apply(combine_notes, axis=1)
-    
-    # Create field content maps for tracking where entities came from
-    def create_field_map(row):
-        """Create a mapping of field -> content for entity source tracking"""
-        field_map = {}
-        for col in df.columns:
-            value = row.get(col, "")
-            if pd.notna(value) and str(value).strip():
-                field_map[col] = str(value).strip()
-        return field_map
-    
-    df['_field_map'] = df.apply(create_field_map, axis=1)
+    # Combine notes from all available columns, skipping empty parts
+    # (each column stringified and stripped once, "" where missing or blank)
+    combined = _stripped_text(df[existing_notes_columns[0]])
+    has_notes = combined != ""
+    for col in existing_notes_columns[1:]:
+        part = _stripped_text(df[col])
+        has_part = part != ""
+        combined = combined.str.cat(part, sep=" | ").where(has_notes & has_part, combined + part)
+        has_notes |= has_part
+    
+    df['combined_notes'] = combined
+    
+    # Field content maps for source tracking are built on demand (make_field_map)
     
     # Filter out rows with no notes
-    df = df[df['combined_notes'].str.strip() != ""]
+    df = df[has_notes]
+    
+    if max_manuscripts:
+        df = df.head(max_manuscripts)
     
     return df
 
 
+def _count_with_notes(df: pd.DataFrame, notes_columns: List[str]) -> int:
+    """Pure helper: Number of rows with text in any of the notes columns"""
+    has_notes = pd.Series(False, index=df.index)
+    for col in notes_columns:
+        if col in df.columns:
+            has_notes |= _stripped_text(df[col]) != ""
+    return int(has_notes.sum())
+
+
+def make_field_map(row: pd.Series) -> Dict[str, str]:
+    """
+    Create a mapping of field -> content for entity source tracking
+    
+    Built on demand for the rows that need it rather than for every loaded row.
+    
+    Args:
+        row: One row of the DataFrame returned by load_excel_data
+        
+    Returns:
+        Dict of field -> stripped text for the row's non-empty fields
+    """
+    return _clean_field_values(row.items())
+
+
+def make_field_maps(df: pd.DataFrame) -> Dict[Hashable, Dict[str, str]]:
+    """
+    Create field maps for many rows at once
+    
+    Rows come out of a single DataFrame.to_dict call instead of one Series
+    per row, which is much cheaper when most rows need a map.
+    
+    Args:
+        df: DataFrame (or row subset) returned by load_excel_data
+        
+    Returns:
+        Dict of row index -> field map, as make_field_map builds it
+    """
+    return {
+        index: _clean_field_values(values.items())
+        for index, values in df.to_dict(orient='index').items()
+    }
+
+
+def _clean_field_values(items: Iterable[Tuple[str, object]]) -> Dict[str, str]:
+    """Pure helper: Stripped, non-empty field texts (short ones interned)"""
+    field_map = {}
+    for col, value in items:
+        if pd.notna(value):
+            text = str(value).strip()
+            if text:
+                field_map[col] = sys.intern(text) if len(text) <= INTERN_MAX_LENGTH else text
+    return field_map
+
+
+def _parse_cache_path(filepath: str) -> Path:
+    """Pure helper: Sibling file holding the parsed sheet of an Excel workbook"""
+    return Path(f"{filepath}{PARSE_CACHE_SUFFIX}")
+
+
+def _workbook_stat(filepath: str) -> bytes:
+    """Size and mtime of a workbook, as stored in (and checked against) its cache"""
+    stat = Path(filepath).stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+
+
+def _read_excel_cached(filepath: str) -> Optional[pd.DataFrame]:
+    """Load the parsed sheet if a cache of the workbook's current version exists"""
+    if pq is None:
+        return None
+    cache = _parse_cache_path(filepath)
+    try:
+        metadata = pq.read_schema(cache).metadata or {}
+        if metadata.get(PARSE_CACHE_STAT_KEY) != _workbook_stat(filepath):
+            return None
+        return pq.read_table(cache).to_pandas()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable parse cache {cache}: {e}")
+        return None
+
+
+def _write_parse_cache(df: pd.DataFrame, filepath: str) -> None:
+    """Store the parsed sheet so later runs skip openpyxl/XML parsing"""
+    if pq is None:
+        return
+    cache = _parse_cache_path(filepath)
+    try:
+        table = pyarrow.Table.from_pandas(_single_typed_columns(df), preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            PARSE_CACHE_STAT_KEY: _workbook_stat(filepath),
+        })
+        pq.write_table(table, cache)
+    except Exception as e:
+        print(f"Warning: Could not write parse cache {cache}: {e}")
+
+
+def _single_typed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pure helper: Copy of a sheet with its mixed-type columns as text
+    
+    Parquet holds one type per column, but a sheet column can mix numbers and
+    text (e.g. 1650 and 'שנת תי"ח' in 260$c). Every consumer reads cells as
+    str(value) anyway, so those columns are cached as their str() values.
+    """
+    single_typed = df
+    for col in df.columns:
+        column = df[col]
+        if column.dtype.kind == "O" and len(set(map(type, column.dropna()))) > 1:
+            if single_typed is df:
+                single_typed = df.copy(deep=False)
+            single_typed[col] = column.map(str, na_action='ignore')
+    return single_typed
+
+
+def _to_nfc(value):
+    """Pure helper: NFC-normalize a string (other values pass through unchanged)"""
+    if isinstance(value, str) and not unicodedata.is_normalized("NFC", value):
+        return unicodedata.normalize("NFC", value)
+    return value
+
+
+@lru_cache(maxsize=8192)
+def _entity_words(entity_value: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Pure helper: NFC form of an entity value and its whitespace-separated words
+    
+    Entity values repeat across manuscripts, so both are computed once per
+    value rather than once per manuscript.
+    """
+    normalized = _to_nfc(entity_value)
+    return normalized, tuple(normalized.split())
+
+
+def _stripped_text(series: pd.Series) -> pd.Series:
+    """Pure helper: Stringify and strip a column, with "" for missing values"""
+    text = series.dropna().map(str).astype(str).str.strip()
+    return text.reindex(series.index, fill_value="")
+
+
 def load_gazetteer(filepath: str, column: str = "location") -> frozenset:
     """
     Load location gazetteer from CSV
@@ -136,7 +347,16 @@ def load_gazetteer(filepath: str, column: str = "location") -> frozenset:
         return frozenset()
     
     try:
-        df = pd.read_csv(filepath)
+        if CSV_ENGINE == "pyarrow":
+            # pyarrow only takes explicit column names, so check the header first
+            if column not in pd.read_csv(filepath, nrows=0).columns:
+                return frozenset()
+            df = pd.read_csv(
+                filepath, usecols=[column], dtype={column: str},
+                engine="pyarrow", dtype_backend="pyarrow"
+            )
+        else:
+            df = pd.read_csv(filepath, usecols=lambda col: col == column, dtype={column: str})
         if column in df.columns:
             locations = df[column].dropna().unique().tolist()
             return frozenset(locations)
@@ -150,15 +370,109 @@ def load_gazetteer(filepath: str, column: str = "location") -> frozenset:
 # OUTPUT OPERATIONS
 # ============================================================================
 
-def save_csv(df: pd.DataFrame, filepath: str) -> None:
-    """Save DataFrame to CSV file"""
+def save_csv(df: pd.DataFrame, filepath: str, chunksize: int = 16384) -> None:
+    """Save DataFrame to CSV file (written in row chunks; '.csv.gz' etc. compress)"""
     output_dir = Path(filepath).parent
     output_dir.mkdir(parents=True, exist_ok=True)
-    df.to_csv(filepath, index=False, encoding='utf-8')
+    if Path(filepath).suffix == ".csv" and _is_plain_text_frame(df):
+        # Text cells need no formatting: rows go straight to a buffered
+        # csv.writer, which quotes exactly as to_csv does
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(df.columns)
+            for start in range(0, len(df), chunksize):
+                chunk = df.iloc[start:start + chunksize]
+                writer.writerows(zip(*(chunk.iloc[:, i].tolist() for i in range(chunk.shape[1]))))
+    else:
+        df.to_csv(filepath, index=False, encoding='utf-8', chunksize=chunksize, compression='infer')
     print(f"✓ Saved: {filepath}")
 
 
-def get_entity_source_field(entity_value: str, source_metadata: Dict, entity_type: str) -> str:
+def _is_plain_text_frame(df: pd.DataFrame) -> bool:
+    """Pure helper: True if every column is a string dtype without missing values"""
+    return df.shape[1] > 0 and all(
+        isinstance(dtype, pd.StringDtype) for dtype in df.dtypes
+    ) and not df.isna().any().any()
+
+
+# Structured fields that can already hold an entity of each type
+STRUCTURED_FIELDS_BY_TYPE = {
+    'date': STRUCTURED_DATE_FIELDS,
+    'location': STRUCTURED_LOCATION_FIELDS,
+    'person': STRUCTURED_PERSON_FIELDS,
+}
+
+# Flat structured field -> entity type (the field sets are disjoint)
+FIELD_TO_ENTITY_TYPE = {
+    field: entity_type
+    for entity_type, structured_fields in STRUCTURED_FIELDS_BY_TYPE.items()
+    for field in structured_fields
+}
+
+
+# entity_type -> (field texts joined by "\n", ((field, text), ...), end offset
+# of each text in the joined string)
+SourceIndex = Dict[str, Tuple[str, Tuple[Tuple[str, str], ...], Tuple[int, ...]]]
+
+
+def build_source_index(source_metadata: Dict) -> SourceIndex:
+    """
+    Pure function: Precompute one manuscript's structured field texts per entity type
+    
+    Args:
+        source_metadata: MARC field data for this manuscript
+        
+    Returns:
+        entity_type -> (all field texts joined, ((field, text), ...) in check
+        order, end offset of each field text within the joined string)
+    """
+    fields_by_type = {entity_type: [] for entity_type in STRUCTURED_FIELDS_BY_TYPE}
+    for field, entity_type in FIELD_TO_ENTITY_TYPE.items():
+        if field in source_metadata:
+            # Pipeline metadata is already stringified; only coerce other values
+            value = source_metadata[field]
+            fields_by_type[entity_type].append((field, value if type(value) is str else str(value)))
+    
+    index = {}
+    for entity_type, fields in fields_by_type.items():
+        ends = []
+        end = -1
+        for _, text in fields:
+            end += len(text) + 1
+            ends.append(end)
+        index[entity_type] = ("\n".join(text for _, text in fields), tuple(fields), tuple(ends))
+    return index
+
+
+def _fields_containing(
+    word: str,
+    joined: str,
+    fields: Tuple[Tuple[str, str], ...],
+    ends: Tuple[int, ...]
+) -> FrozenSet[str]:
+    """
+    Pure helper: Fields whose text contains a word, from one sweep of the joined text
+    
+    The word must be non-empty and free of whitespace, so a match never
+    crosses the "\n" between two field texts; after a match the search
+    resumes at the next field.
+    """
+    found = []
+    pos = joined.find(word)
+    while pos != -1:
+        i = bisect_right(ends, pos)
+        found.append(fields[i][0])
+        pos = joined.find(word, ends[i] + 1)
+    return frozenset(found)
+
+
+def get_entity_source_field(
+    entity_value: str,
+    source_metadata: Dict,
+    entity_type: str,
+    source_index: Optional[SourceIndex] = None,
+    word_hits: Optional[Dict[str, FrozenSet[str]]] = None
+) -> str:
     """
     Determine which MARC field an entity came from
     
@@ -166,28 +480,43 @@ def get_entity_source_field(entity_value: str, source_metadata: Dict, entity_typ
         entity_value: The extracted entity value
         source_metadata: MARC field data for this manuscript
         entity_type: Type of entity ('date', 'location', 'person')
+        source_index: Optional build_source_index() result for source_metadata
+        word_hits: Optional memo of word -> fields containing it, owned by the
+            caller and reused across entities of the same manuscript and type
         
     Returns:
         Field name if found in non-note field, "new data" if only in note fields
     """
-    # Determine which structured fields to check based on entity type
-    if entity_type == 'date':
-        structured_fields = STRUCTURED_DATE_FIELDS
-    elif entity_type == 'location':
-        structured_fields = STRUCTURED_LOCATION_FIELDS
-    elif entity_type == 'person':
-        structured_fields = STRUCTURED_PERSON_FIELDS
-    else:
+    if entity_type not in STRUCTURED_FIELDS_BY_TYPE:
         return "new data"
     
-    # Check if entity appears in any non-note (structured) field
-    found_in_fields = []
-    for field in structured_fields:
-        if field in source_metadata:
-            field_value = str(source_metadata[field])
-            # Check if entity value appears in this field
-            if entity_value in field_value or any(part in field_value for part in entity_value.split()):
-                found_in_fields.append(field)
+    # Field texts are NFC from load_excel_data; match entities in the same form
+    entity_value, words = _entity_words(entity_value)
+    
+    if source_index is None:
+        source_index = build_source_index(source_metadata)
+    joined, fields, ends = source_index[entity_type]
+    if word_hits is None:
+        word_hits = {}
+    
+    # A field matches if it contains the entity or any of its words; a field
+    # containing the entity contains each word, so the words alone decide
+    if not words:
+        # Blank value: test it against each field as a whole
+        matched = {field for field, field_value in fields if entity_value in field_value}
+    else:
+        matched = set()
+        for word in words:
+            fields_with_word = word_hits.get(word)
+            if fields_with_word is None:
+                # One sweep over all field texts joined, jumping to the next
+                # field after each match
+                fields_with_word = _fields_containing(word, joined, fields, ends)
+                word_hits[word] = fields_with_word
+            matched |= fields_with_word
+    
+    # Report matching non-note fields in check order
+    found_in_fields = [field for field, _ in fields if field in matched]
     
     if found_in_fields:
         # Found in structured field(s) - return field name(s)
@@ -197,9 +526,240 @@ def get_entity_source_field(entity_value: str, source_metadata: Dict, entity_typ
         return "new data"
 
 
+# Classification map of manuscripts without classified entities
+_NO_LABELS: Dict[str, str] = {}
+
+
+class SourceFieldResolver:
+    """
+    Memoizes get_entity_source_field per (manuscript, entity_value, entity_type)
+    
+    One resolver is shared by the exports of a single save so each entity's
+    source field is computed once, however many tables report it; the
+    formatted entity columns are likewise shared via format_entities().
+    
+    Caches are keyed by manuscript object, not manuscript_id: IDs need not
+    be unique (rows without an 001 value all read "nan"). The resolver keeps
+    every manuscript it has seen alive so their id()s cannot be reused.
+    """
+    
+    def __init__(self):
+        self._manuscripts: Dict[int, Manuscript] = {}
+        self._fields: Dict[Tuple[int, str, str], str] = {}
+        self._formatted: Dict[Tuple[int, Optional[int]], Tuple[str, str, str, str]] = {}
+        self._classified: Dict[int, List[ClassifiedEntity]] = {}
+        self._indexes: Dict[int, SourceIndex] = {}
+        self._word_hits: Dict[Tuple[int, str], Dict[str, FrozenSet[str]]] = {}
+    
+    def _key(self, ms: Manuscript) -> int:
+        """Cache key of a manuscript (its id(), held valid by keeping it alive)"""
+        key = id(ms)
+        if key not in self._manuscripts:
+            self._manuscripts[key] = ms
+        return key
+    
+    def resolve(self, ms: Manuscript, entity_value: str, entity_type: str) -> str:
+        """Return the (cached) source field label for an entity of a manuscript"""
+        ms_key = self._key(ms)
+        key = (ms_key, entity_value, entity_type)
+        field = self._fields.get(key)
+        if field is None:
+            source_index = self._indexes.get(ms_key)
+            if source_index is None:
+                source_index = build_source_index(ms.source_metadata)
+                self._indexes[ms_key] = source_index
+            word_hits = self._word_hits.setdefault((ms_key, entity_type), {})
+            field = get_entity_source_field(
+                entity_value, ms.source_metadata, entity_type, source_index, word_hits
+            )
+            self._fields[key] = field
+        return field
+    
+    def format_entities(
+        self,
+        ms: Manuscript,
+        classified_entities: Optional[List[ClassifiedEntity]]
+    ) -> Tuple[str, str, str, str]:
+        """
+        Format a manuscript's "value | classification | source_field" columns
+        
+        Args:
+            ms: Manuscript to format
+            classified_entities: Its classified entities (None if unclassified)
+            
+        Returns:
+            (dates, locations, persons by full name, persons by name), cached
+            per manuscript object and classification list
+        """
+        classified_key = None
+        if classified_entities:
+            classified_key = id(classified_entities)
+            self._classified[classified_key] = classified_entities  # keeps the id valid
+        key = (self._key(ms), classified_key)
+        formatted = self._formatted.get(key)
+        if formatted is not None:
+            return formatted
+        
+        # Map of entity value -> classification label (bound methods hoisted
+        # out of the per-entity loops); unclassified manuscripts share one
+        # empty map, so every entity gets its default label
+        label_of = (
+            {ce.value: ce.label for ce in classified_entities}.get
+            if classified_entities else _NO_LABELS.get
+        )
+        resolve = self.resolve
+        
+        dates_str = _format_entity_column(tuple([
+            (value, label_of(value, 'unclassified'), resolve(ms, value, 'date'))
+            for value in [e.value for e in ms.dates]
+        ]))
+        
+        locations_str = _format_entity_column(tuple([
+            (value, label_of(value, 'unclassified'), resolve(ms, value, 'location'))
+            for value in [e.value for e in ms.locations]
+        ]))
+        
+        # Persons are listed by full name in the main table, by name in the detailed one
+        full_name_entries = []
+        name_entries = []
+        add_full_name = full_name_entries.append
+        add_name = name_entries.append
+        for p in ms.persons:
+            name = p.name
+            label = label_of(name, p.role if p.role else 'extracted_person')
+            source_field = resolve(ms, name, 'person')
+            add_full_name((p.full_name, label, source_field))
+            add_name((name, label, source_field))
+        
+        formatted = (
+            dates_str,
+            locations_str,
+            _format_entity_column(tuple(full_name_entries)),
+            _format_entity_column(tuple(name_entries)),
+        )
+        self._formatted[key] = formatted
+        return formatted
+
+
+@lru_cache(maxsize=4096)
+def _format_entity_column(entries: Tuple[Tuple[str, str, str], ...]) -> str:
+    """Pure helper: Join (value, classification, source_field) entries into one column text"""
+    return ", ".join([" | ".join(entry) for entry in entries])
+
+
+# Fixed leading columns of the manuscripts table (source metadata follows)
+MANUSCRIPT_ROW_FIELDS = (
+    "manuscript_id", "notes_text", "dates", "locations", "persons",
+    "has_colophon", "scribe_name", "work_title", "num_events", "production_events",
+)
+
+# Fixed columns of the other export tables
+EVENT_ROW_FIELDS = (
+    "manuscript_id", "event_type", "event_class", "date", "place", "actor",
+    "has_temporal_info", "has_spatial_info",
+)
+CLASSIFICATION_ROW_FIELDS = ("manuscript_id", "date_relations", "location_relations", "event_classes")
+DETAILED_ROW_FIELDS = ("manuscript_id", "dates", "locations", "persons")
+
+# Known dtypes of fixed columns, so pandas need not infer them (event type and
+# class are drawn from a handful of values and stored as categoricals)
+MANUSCRIPT_COLUMN_DTYPES = {"has_colophon": "bool", "num_events": "int32", "production_events": "int32"}
+EVENT_COLUMN_DTYPES = {
+    "event_type": "category", "event_class": "category",
+    "has_temporal_info": "bool", "has_spatial_info": "bool",
+}
+
+# EventClass -> its class name string (Enum.value goes through a descriptor)
+EVENT_CLASS_VALUES = {event_class: event_class.value for event_class in EventClass}
+
+# Below this many manuscripts, worker start-up and pickling outweigh parallel formatting
+PARALLEL_MIN_MANUSCRIPTS = 1000
+
+
+def _iter_rows(
+    row_func: Callable[..., Iterator[Tuple]],
+    manuscripts: List[Manuscript],
+    maps: Tuple[Optional[Dict[str, List]], ...] = (),
+    max_workers: Optional[int] = None,
+    resolver: Optional[SourceFieldResolver] = None
+) -> Iterator[Tuple]:
+    """
+    Yield row_func's export rows for all manuscripts, in manuscript order
+    
+    With max_workers > 1 and enough manuscripts, chunks of manuscripts are
+    formatted in worker processes; each chunk only ships the slices of the
+    manuscript_id-keyed maps it needs, and workers use their own resolver.
+    
+    Args:
+        row_func: Module-level row generator taking (manuscripts, *maps[, resolver])
+        manuscripts: List of Manuscript objects
+        maps: manuscript_id-keyed classification maps passed through to row_func
+        max_workers: Worker processes to use (None/1 formats in-process)
+        resolver: Source-field cache for in-process formatting
+    """
+    if not max_workers or max_workers <= 1 or len(manuscripts) < PARALLEL_MIN_MANUSCRIPTS:
+        extra = (resolver,) if resolver is not None else ()
+        yield from row_func(manuscripts, *maps, *extra)
+        return
+    
+    chunksize = max(1, len(manuscripts) // (8 * max_workers))
+    chunks = [manuscripts[i:i + chunksize] for i in range(0, len(manuscripts), chunksize)]
+    sliced_maps = [
+        [
+            mapping if not mapping else {
+                ms.manuscript_id: mapping[ms.manuscript_id]
+                for ms in chunk if ms.manuscript_id in mapping
+            }
+            for chunk in chunks
+        ]
+        for mapping in maps
+    ]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for rows in executor.map(_collect_rows, repeat(row_func), chunks, *sliced_maps):
+            yield from rows
+
+
+def _collect_rows(row_func: Callable[..., Iterator[Tuple]], manuscripts: List[Manuscript], *maps) -> List[Tuple]:
+    """Pure helper: Materialize a row generator (worker-process entry point)"""
+    return list(row_func(manuscripts, *maps))
+
+
+def _frame_from_rows(
+    rows: Iterable[Tuple],
+    columns: Tuple[str, ...],
+    dtypes: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """Pure helper: Build a DataFrame column-wise (one list per column) from row tuples"""
+    values = list(zip(*rows))
+    if not values:
+        # No rows: the same column-less frame pd.DataFrame([]) gives
+        return pd.DataFrame()
+    return pd.DataFrame({
+        col: _typed_column(column, (dtypes or {}).get(col))
+        for col, column in zip(columns, values)
+    })
+
+
+def _typed_column(values: Iterable, dtype: Optional[str]):
+    """Pure helper: Column data for a DataFrame, with its dtype when known"""
+    return list(values) if dtype is None else pd.Series(values, dtype=dtype)
+
+
+def _manuscript_columns(manuscripts: List[Manuscript]) -> List[str]:
+    """Pure helper: Manuscripts table header (union of row keys in first-seen order)"""
+    columns = dict.fromkeys(MANUSCRIPT_ROW_FIELDS if manuscripts else ())
+    for ms in manuscripts:
+        columns.update(dict.fromkeys(ms.source_metadata))
+    return list(columns)
+
+
 def manuscripts_to_dataframe(
     manuscripts: List[Manuscript], 
-    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None
+    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None,
+    resolver: Optional[SourceFieldResolver] = None,
+    max_workers: Optional[int] = None,
+    include_passthrough: bool = True
 ) -> pd.DataFrame:
     """
     Convert manuscripts to flat DataFrame for CSV export
@@ -207,95 +767,179 @@ def manuscripts_to_dataframe(
     Args:
         manuscripts: List of Manuscript objects
         classified_map: Optional map of classifications for embedded format
+        resolver: Optional source-field cache shared with other exports
+        max_workers: Optional worker processes for row formatting
+        include_passthrough: Append each manuscript's source metadata columns
         
     Returns:
         DataFrame with extracted information
     """
-    rows = []
+    rows = _iter_rows(
+        _iter_manuscript_rows, manuscripts, (classified_map,), max_workers, resolver
+    )
+    if not include_passthrough:
+        return _frame_from_rows(
+            (fixed for fixed, _ in rows), MANUSCRIPT_ROW_FIELDS, MANUSCRIPT_COLUMN_DTYPES
+        )
+    
+    rows = list(rows)
+    if not rows:
+        return pd.DataFrame()
+    
+    fixed_rows, metadata_rows = zip(*rows)
+    fixed_columns = dict(zip(MANUSCRIPT_ROW_FIELDS, zip(*fixed_rows)))
+    
+    # Columns are filled one at a time; metadata wins over a same-named
+    # fixed field and missing metadata is NaN, as with a list of row dicts
+    missing = float("nan")
+    metadata_columns = set().union(*metadata_rows)
+    columns = {}
+    for col in _manuscript_columns(manuscripts):
+        fixed = fixed_columns.get(col)
+        if col not in metadata_columns:
+            # Fixed field no manuscript overrides: take the column as built
+            columns[col] = _typed_column(fixed, MANUSCRIPT_COLUMN_DTYPES.get(col))
+        elif fixed is None:
+            columns[col] = [metadata.get(col, missing) for metadata in metadata_rows]
+        else:
+            columns[col] = [metadata.get(col, value) for metadata, value in zip(metadata_rows, fixed)]
+    
+    return pd.DataFrame(columns)
+
+
+def write_manuscripts_csv(
+    manuscripts: List[Manuscript],
+    filepath: str,
+    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None,
+    resolver: Optional[SourceFieldResolver] = None,
+    max_workers: Optional[int] = None
+) -> None:
+    """
+    Stream the manuscripts table straight to CSV, one row at a time
+    
+    Writes the same file as save_csv(manuscripts_to_dataframe(...)) without
+    materializing the row list or the DataFrame.
+    
+    Args:
+        manuscripts: List of Manuscript objects
+        filepath: Output CSV path
+        classified_map: Optional map of classifications for embedded format
+        resolver: Optional source-field cache shared with other exports
+        max_workers: Optional worker processes for row formatting
+    """
+    columns = _manuscript_columns(manuscripts)
+    
+    # Each column reads its metadata value, else its fixed value, else ""
+    fixed_index = {col: i for i, col in enumerate(MANUSCRIPT_ROW_FIELDS)}
+    layout = [(col, fixed_index.get(col)) for col in columns]
+    
+    output_dir = Path(filepath).parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+    with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(columns)
+        for fixed, metadata in _iter_rows(
+            _iter_manuscript_rows, manuscripts, (classified_map,), max_workers, resolver
+        ):
+            writer.writerow([
+                metadata.get(col, "") if i is None else metadata.get(col, fixed[i])
+                for col, i in layout
+            ])
+    print(f"✓ Saved: {filepath}")
+
+
+def _iter_manuscript_rows(
+    manuscripts: List[Manuscript],
+    classified_map: Optional[Dict[str, List[ClassifiedEntity]]],
+    resolver: Optional[SourceFieldResolver] = None
+) -> Iterator[Tuple[Tuple, Dict]]:
+    """Yield (MANUSCRIPT_ROW_FIELDS values, source metadata) per manuscript"""
+    if resolver is None:
+        resolver = SourceFieldResolver()
+    
+    format_entities = resolver.format_entities
+    classification_of = classified_map.get if classified_map else None
     
     for ms in manuscripts:
+        ms_id = ms.manuscript_id
+        
         # Get classifications if available, otherwise use defaults
-        classification_map = {}
-        if classified_map and ms.manuscript_id in classified_map:
-            classified_entities = classified_map[ms.manuscript_id]
-            classification_map = {ce.value: ce.label for ce in classified_entities}
+        classified_entities = classification_of(ms_id) if classification_of else None
         
         # Format: "value | classification | source_field"
-        dates_str = ", ".join(
-            f"{e.value} | {classification_map.get(e.value, 'unclassified')} | {get_entity_source_field(e.value, ms.source_metadata, 'date')}" 
-            for e in ms.dates
-        ) if ms.dates else ""
+        dates_str, locations_str, persons_str, _ = format_entities(ms, classified_entities)
         
-        locations_str = ", ".join(
-            f"{e.value} | {classification_map.get(e.value, 'unclassified')} | {get_entity_source_field(e.value, ms.source_metadata, 'location')}" 
-            for e in ms.locations
-        ) if ms.locations else ""
+        # primary_scribe searches the persons list, so resolve it once
+        scribe = ms.primary_scribe
+        work = ms.work
         
-        persons_str = ", ".join(
-            f"{p.full_name} | {classification_map.get(p.name, p.role if p.role else 'extracted_person')} | {get_entity_source_field(p.name, ms.source_metadata, 'person')}" 
-            for p in ms.persons
-        ) if ms.persons else ""
-        
-        row = {
-            "manuscript_id": ms.manuscript_id,
-            "notes_text": ms.notes_text,
+        row = (
+            ms_id,
+            ms.notes_text,
             
             # Extracted entities with classifications AND source fields
-            "dates": dates_str,
-            "locations": locations_str,
-            "persons": persons_str,
+            dates_str,
+            locations_str,
+            persons_str,
             
             # Structured information
-            "has_colophon": ms.has_colophon,
-            "scribe_name": ms.primary_scribe.full_name if ms.primary_scribe else "",
-            "work_title": ms.work.title if ms.work else "",
+            ms.has_colophon,
+            scribe.full_name if scribe else "",
+            work.title if work else "",
             
             # Event count
-            "num_events": len(ms.events),
-            "production_events": len(ms.production_events),
-        }
-        
-        # Add source metadata
-        row.update(ms.source_metadata)
+            len(ms.events),
+            len(ms.production_events),
+        )
         
-        rows.append(row)
-    
-    return pd.DataFrame(rows)
+        # Source metadata columns follow (and override same-named fields)
+        yield row, ms.source_metadata
 
 
-def events_to_dataframe(manuscripts: List[Manuscript]) -> pd.DataFrame:
+def events_to_dataframe(
+    manuscripts: List[Manuscript],
+    max_workers: Optional[int] = None
+) -> pd.DataFrame:
     """
     Convert all events to structured DataFrame
     
     Args:
         manuscripts: List of Manuscript objects
+        max_workers: Optional worker processes for row formatting
         
     Returns:
-        DataFrame with all events
+        DataFrame with all events (event_type and event_class are categorical)
     """
-    rows = []
-    
+    return _frame_from_rows(
+        _iter_rows(_iter_event_rows, manuscripts, max_workers=max_workers),
+        EVENT_ROW_FIELDS, EVENT_COLUMN_DTYPES
+    )
+
+
+def _iter_event_rows(manuscripts: List[Manuscript]) -> Iterator[Tuple]:
+    """Yield one EVENT_ROW_FIELDS row per event"""
     for ms in manuscripts:
+        ms_id = ms.manuscript_id
         for event in ms.events:
-            row = {
-                "manuscript_id": ms.manuscript_id,
-                "event_type": event.event_type,
-                "event_class": event.event_class.value,
-                "date": event.date or "",
-                "place": event.place.name if event.place else "",
-                "actor": event.actor.full_name if event.actor else "",
-                "has_temporal_info": event.has_temporal_info,
-                "has_spatial_info": event.has_spatial_info,
-            }
-            rows.append(row)
-    
-    return pd.DataFrame(rows)
+            place = event.place
+            actor = event.actor
+            yield (
+                ms_id,
+                event.event_type,
+                EVENT_CLASS_VALUES[event.event_class],
+                event.date or "",
+                place.name if place else "",
+                actor.full_name if actor else "",
+                event.has_temporal_info,
+                event.has_spatial_info,
+            )
 
 
 def classified_entities_to_dataframe(
     manuscripts: List[Manuscript],
     classified_dates: Dict[str, List],
-    classified_locations: Dict[str, List]
+    classified_locations: Dict[str, List],
+    max_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Add classification information to manuscripts DataFrame
@@ -304,12 +948,26 @@ def classified_entities_to_dataframe(
         manuscripts: List of Manuscript objects
         classified_dates: Mapping of manuscript_id to classified dates
         classified_locations: Mapping of manuscript_id to classified locations
+        max_workers: Optional worker processes for row formatting
         
     Returns:
         DataFrame with classification columns
     """
-    rows = []
-    
+    return _frame_from_rows(
+        _iter_rows(
+            _iter_classification_rows, manuscripts,
+            (classified_dates, classified_locations), max_workers
+        ),
+        CLASSIFICATION_ROW_FIELDS
+    )
+
+
+def _iter_classification_rows(
+    manuscripts: List[Manuscript],
+    classified_dates: Dict[str, List],
+    classified_locations: Dict[str, List]
+) -> Iterator[Tuple]:
+    """Yield one CLASSIFICATION_ROW_FIELDS row per manuscript"""
     for ms in manuscripts:
         ms_id = ms.manuscript_id
         
@@ -330,23 +988,21 @@ def classified_entities_to_dataframe(
             ]
         
         # Event classes
-        event_classes = [e.event_class.value for e in ms.events]
-        
-        row = {
-            "manuscript_id": ms_id,
-            "date_relations": "; ".join(date_relations),
-            "location_relations": "; ".join(loc_relations),
-            "event_classes": "; ".join(event_classes),
-        }
+        event_classes = [EVENT_CLASS_VALUES[e.event_class] for e in ms.events]
         
-        rows.append(row)
-    
-    return pd.DataFrame(rows)
+        yield (
+            ms_id,
+            "; ".join(date_relations),
+            "; ".join(loc_relations),
+            "; ".join(event_classes),
+        )
 
 
 def create_detailed_entities_dataframe(
     manuscripts: List[Manuscript],
-    classified_map: Dict[str, List[ClassifiedEntity]]
+    classified_map: Dict[str, List[ClassifiedEntity]],
+    resolver: Optional[SourceFieldResolver] = None,
+    max_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Create detailed entities DataFrame with classifications embedded in entity columns
@@ -355,64 +1011,85 @@ def create_detailed_entities_dataframe(
     Args:
         manuscripts: List of manuscripts
         classified_map: Map of manuscript_id to classified entities
+        resolver: Optional source-field cache shared with other exports
+        max_workers: Optional worker processes for row formatting
         
     Returns:
         DataFrame with manuscript-centric view of classified entities
     """
-    rows = []
+    return _frame_from_rows(
+        _iter_rows(_iter_detailed_rows, manuscripts, (classified_map,), max_workers, resolver),
+        DETAILED_ROW_FIELDS
+    )
+
+
+def _iter_detailed_rows(
+    manuscripts: List[Manuscript],
+    classified_map: Dict[str, List[ClassifiedEntity]],
+    resolver: Optional[SourceFieldResolver] = None
+) -> Iterator[Tuple]:
+    """Yield one DETAILED_ROW_FIELDS row per manuscript that has any entities"""
+    if resolver is None:
+        resolver = SourceFieldResolver()
     
     for ms in manuscripts:
+        # Manuscripts without entities never get a row; skip the lookups
+        if not (ms.dates or ms.locations or ms.persons):
+            continue
         ms_id = ms.manuscript_id
-        source_meta = ms.source_metadata
-        
-        # Get classifications for this manuscript
-        classified_entities = classified_map.get(ms_id, [])
-        
-        # Create a map of entity value -> classification label
-        classification_map = {ce.value: ce.label for ce in classified_entities}
-        
-        # Process dates - create "value | classification | source_field" format
-        date_entries = []
-        for date_entity in ms.dates:
-            date_value = date_entity.value
-            classification = classification_map.get(date_value, "unclassified")
-            source_field = get_entity_source_field(date_value, source_meta, 'date')
-            date_entries.append(f"{date_value} | {classification} | {source_field}")
-        
-        # Process locations - create "value | classification | source_field" format
-        location_entries = []
-        for loc_entity in ms.locations:
-            loc_value = loc_entity.value
-            classification = classification_map.get(loc_value, "unclassified")
-            source_field = get_entity_source_field(loc_value, source_meta, 'location')
-            location_entries.append(f"{loc_value} | {classification} | {source_field}")
         
-        # Process persons - create "value | classification | source_field" format
-        person_entries = []
-        for person in ms.persons:
-            person_name = person.name
-            # Check if person was classified
-            classification = classification_map.get(person_name, person.role if person.role else "extracted_person")
-            source_field = get_entity_source_field(person_name, source_meta, 'person')
-            person_entries.append(f"{person_name} | {classification} | {source_field}")
+        # Reuses the strings already formatted for the main table when the
+        # resolver is shared (persons are listed by name here)
+        dates_str, locations_str, _, persons_str = resolver.format_entities(
+            ms, classified_map.get(ms_id)
+        )
         
         # Only add row if there are any entities
-        if date_entries or location_entries or person_entries:
-            rows.append({
-                'manuscript_id': ms_id,
-                'dates': ', '.join(date_entries) if date_entries else '',
-                'locations': ', '.join(location_entries) if location_entries else '',
-                'persons': ', '.join(person_entries) if person_entries else ''
-            })
+        if dates_str or locations_str or persons_str:
+            yield (ms_id, dates_str, locations_str, persons_str)
+
+
+def entity_frequency_columns(
+    manuscripts: List[Manuscript],
+    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None,
+    resolver: Optional[SourceFieldResolver] = None
+) -> pd.DataFrame:
+    """
+    Build just the dates and locations columns save_frequency_tables() reads
+    
+    Args:
+        manuscripts: List of Manuscript objects
+        classified_map: Optional map of manuscript_id -> classified entities
+        resolver: Optional source-field cache shared with other exports
+        
+    Returns:
+        DataFrame with the main table's dates and locations columns
+    """
+    if resolver is None:
+        resolver = SourceFieldResolver()
+    format_entities = resolver.format_entities
+    classification_of = classified_map.get if classified_map else None
+    
+    dates = []
+    locations = []
+    for ms in manuscripts:
+        classified_entities = classification_of(ms.manuscript_id) if classification_of else None
+        dates_str, locations_str, _, _ = format_entities(ms, classified_entities)
+        dates.append(dates_str)
+        locations.append(locations_str)
     
-    return pd.DataFrame(rows)
+    return pd.DataFrame({"dates": dates, "locations": locations})
 
 
 def save_extraction_results(
     result: ExtractionResult,
     output_dir: str,
     prefix: str = "manuscript_extraction",
-    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None
+    classified_map: Optional[Dict[str, List[ClassifiedEntity]]] = None,
+    max_workers: Optional[int] = None,
+    source_df: Optional[pd.DataFrame] = None,
+    id_column: str = "001",
+    frequency_tables: bool = False
 ) -> Dict[str, str]:
     """
     Save complete extraction results to multiple files
@@ -422,6 +1099,11 @@ def save_extraction_results(
         output_dir: Output directory path
         prefix: Filename prefix
         classified_map: Optional map of classifications for detailed export
+        max_workers: Optional worker processes for row formatting
+        source_df: Optional loaded sheet (load_excel_data) to join passthrough
+            columns from, instead of each manuscript's source_metadata
+        id_column: Column of source_df holding the manuscript IDs
+        frequency_tables: Also save the dates/locations frequency tables
         
     Returns:
         Dictionary of saved file paths
@@ -430,22 +1112,37 @@ def save_extraction_results(
     output_path.mkdir(parents=True, exist_ok=True)
     
     saved_files = {}
+    resolver = SourceFieldResolver()
     
     # Main manuscripts CSV (with classifications if available)
-    manuscripts_df = manuscripts_to_dataframe(result.manuscripts, classified_map)
     main_path = output_path / f"{prefix}_entities.csv"
-    save_csv(manuscripts_df, str(main_path))
+    if source_df is None:
+        write_manuscripts_csv(result.manuscripts, str(main_path), classified_map, resolver, max_workers)
+    else:
+        # Passthrough columns come straight from the sheet in one left join
+        entities_df = manuscripts_to_dataframe(
+            result.manuscripts, classified_map, resolver, max_workers, include_passthrough=False
+        )
+        if not entities_df.empty:
+            source = source_df.drop(columns=['combined_notes'], errors='ignore')
+            source = source.assign(**{id_column: source[id_column].astype(str)})
+            entities_df = entities_df.merge(
+                source, left_on='manuscript_id', right_on=id_column, how='left'
+            )
+        save_csv(entities_df, str(main_path))
     saved_files["entities"] = str(main_path)
     
     # Detailed entities CSV with classifications (if available)
     if classified_map:
-        detailed_entities_df = create_detailed_entities_dataframe(result.manuscripts, classified_map)
+        detailed_entities_df = create_detailed_entities_dataframe(
+            result.manuscripts, classified_map, resolver, max_workers
+        )
         detailed_path = output_path / f"{prefix}_entities_detailed.csv"
         save_csv(detailed_entities_df, str(detailed_path))
         saved_files["entities_detailed"] = str(detailed_path)
     
     # Events CSV
-    events_df = events_to_dataframe(result.manuscripts)
+    events_df = events_to_dataframe(result.manuscripts, max_workers)
     events_path = output_path / f"{prefix}_events.csv"
     save_csv(events_df, str(events_path))
     saved_files["events"] = str(events_path)
@@ -456,6 +1153,13 @@ def save_extraction_results(
     save_csv(summary_df, str(summary_path))
     saved_files["summary"] = str(summary_path)
     
+    # Frequency tables read only the dates/locations columns; the shared
+    # resolver reuses whatever formatting the exports above did in-process
+    if frequency_tables:
+        saved_files.update(save_frequency_tables(
+            entity_frequency_columns(result.manuscripts, classified_map, resolver), output_dir
+        ))
+    
     return saved_files
 
 
@@ -475,26 +1179,17 @@ def explode_and_count(
     Returns:
         DataFrame with value counts
     """
-    all_values = []
+    values = series.dropna().map(str).astype(object)
+    parts = values.str.split(separator, regex=False).explode().str.strip()
+    all_values = parts[parts.notna() & (parts != "")]
     
-    for val in series:
-        if pd.notna(val) and str(val).strip():
-            parts = str(val).split(separator)
-            for p in parts:
-                p = p.strip()
-                if p:
-                    all_values.append(p)
-    
-    if not all_values:
+    if all_values.empty:
         return pd.DataFrame(columns=["value", "count"])
     
-    counts = pd.Series(all_values).value_counts()
+    counts = all_values.value_counts()
     counts = counts[counts >= min_count]
     
-    return pd.DataFrame({
-        "value": counts.index,
-        "count": counts.values
-    })
+    return counts.rename_axis("value").reset_index(name="count")
 
 
 def save_frequency_tables(
@@ -2,12 +2,71 @@
 Kima & Maagarim Gazetteer Loader
 Loads and indexes the three-file gazetteer system from Dr. Sinai Rosnik
 """
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence
 from pathlib import Path
 import csv
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
 
+# Master file columns kept per place: place_data key -> TSV column
+# ('id' and 'hebrew' come from the required Id/primary_heb_full columns)
+PLACE_COLUMNS = (
+    ('romanized', 'primary_rom_full'),
+    ('viaf', 'VIAF_ID'),
+    ('geonames', 'Geoname_ID'),
+    ('wikidata', 'WD'),
+    ('lat', 'lat'),
+    ('lon', 'lon'),
+    ('description', 'Desc'),
+    ('mazal_id', 'MAZAL_ID'),
+)
+
+# place_data keys in dict order
+PLACE_KEYS = ('id', 'hebrew') + tuple(key for key, _ in PLACE_COLUMNS)
+
+# Memoized fallback lookups (textual forms, variants, prefix stripping);
+# sized to hold a corpus' distinct place mentions without evicting
+LOOKUP_CACHE_SIZE = 200_000
+
+
+def _iter_tsv_rows(file_path: Path, required: Sequence[str], optional: Sequence[str] = ()) -> Iterator[list]:
+    """
+    Yield the requested columns of each TSV row, by position
+    
+    Column indices are resolved once from the header instead of building a
+    dict per row. Values match csv.DictReader's: an optional column missing
+    from the header reads as '', a field missing from a short row as None,
+    and blank lines are skipped.
+    
+    Args:
+        file_path: Tab-separated file with a header row
+        required: Columns that must be in the header (KeyError otherwise)
+        optional: Columns that may be absent
+    
+    Returns:
+        Iterator of value lists (required columns first, then optional)
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        header = next(reader, [])
+        # Last occurrence wins for duplicate names, as with DictReader
+        positions = {name: i for i, name in enumerate(header)}
+        for name in required:
+            if name not in positions:
+                raise KeyError(name)
+        indices = [positions[name] for name in required] + [positions.get(name) for name in optional]
+        width = len(header)
+        
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [None] * (width - len(row))
+            yield [row[i] if i is not None else '' for i in indices]
+
+
 class KimaGazetteer:
     """Unified gazetteer combining Kima places, variants, and Maagarim forms"""
     
@@ -20,8 +79,14 @@ class KimaGazetteer:
         """
         self.data_dir = Path(data_dir)
         
-        # Master gazetteer: canonical_name → place_data
-        self.places: Dict[str, dict] = {}
+        # Master gazetteer, stored column-wise: place_data key → one value
+        # per master file row, and canonical_name → row (all name keys are
+        # interned to match interned text tokens). Place dicts are only
+        # built for looked-up places; see _place_data() and places.
+        self.place_columns: Dict[str, List[str]] = {key: [] for key in PLACE_KEYS}
+        self.place_rows: Dict[str, int] = {}
+        self._place_dicts: Dict[int, dict] = {}
+        self._all_names: Optional[FrozenSet[str]] = None
         
         # Variant lookup: variant_name → canonical_name
         self.variants: Dict[str, str] = {}
@@ -32,6 +97,9 @@ class KimaGazetteer:
         # Reverse index: PlaceId → canonical_name
         self.place_id_index: Dict[str, str] = {}
         
+        # Token counts present among all lookup keys (skips impossible n-grams)
+        self.phrase_lengths: FrozenSet[int] = frozenset()
+        
         # Load all data
         self._load_all()
     
@@ -39,10 +107,19 @@ class KimaGazetteer:
         """Load all three files"""
         csv.field_size_limit(1000000)  # Handle large fields
         
-        # Order matters: load places first to build id index
+        # Order matters: load places first to build id index; the other two
+        # files only read that index, so they load side by side
         self._load_master_gazetteer()
-        self._load_variants()
-        self._load_maagarim_forms()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            loads = [executor.submit(self._load_variants), executor.submit(self._load_maagarim_forms)]
+            for load in loads:
+                load.result()
+        
+        self.phrase_lengths = frozenset(
+            name.count(" ") + 1
+            for index in (self.place_rows, self.variants, self.textual_forms)
+            for name in index
+        )
     
     def _load_master_gazetteer(self):
         """Load Kima Places master file"""
@@ -51,27 +128,41 @@ class KimaGazetteer:
         if not file_path.exists():
             raise FileNotFoundError(f"Kima places file not found: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                canonical = row['primary_heb_full']
-                place_id = row['Id']
-                
-                self.places[canonical] = {
-                    'id': place_id,
-                    'hebrew': canonical,
-                    'romanized': row.get('primary_rom_full', ''),
-                    'viaf': row.get('VIAF_ID', ''),
-                    'geonames': row.get('Geoname_ID', ''),
-                    'wikidata': row.get('WD', ''),
-                    'lat': row.get('lat', ''),
-                    'lon': row.get('lon', ''),
-                    'description': row.get('Desc', ''),
-                    'mazal_id': row.get('MAZAL_ID', ''),
-                }
-                
-                # Build reverse index for variant lookup
-                self.place_id_index[place_id] = canonical
+        appends = [self.place_columns[key].append for key in PLACE_KEYS]
+        rows = _iter_tsv_rows(
+            file_path, ['Id', 'primary_heb_full'], [column for _, column in PLACE_COLUMNS]
+        )
+        # Short rows missing the name have nothing to index (row numbers
+        # count the stored rows only, as they index the place columns)
+        rows = (values for values in rows if values[1] is not None)
+        for row_number, values in enumerate(rows):
+            place_id = values[0]
+            canonical = values[1] = sys.intern(values[1])
+            for append, value in zip(appends, values):
+                append(value)
+            
+            # A repeated canonical name keeps its last row
+            self.place_rows[canonical] = row_number
+            
+            # Build reverse index for variant lookup
+            self.place_id_index[place_id] = canonical
+    
+    def _place_data(self, row: int) -> dict:
+        """Return the place_data dict of one master file row (built once)"""
+        place = self._place_dicts.get(row)
+        if place is None:
+            place = {key: self.place_columns[key][row] for key in PLACE_KEYS}
+            self._place_dicts[row] = place
+        return place
+    
+    @property
+    def places(self) -> Dict[str, dict]:
+        """
+        Master gazetteer as canonical_name → place_data (for backward compatibility)
+        
+        Builds every place dict, so prefer lookup() for single places.
+        """
+        return {canonical: self._place_data(row) for canonical, row in self.place_rows.items()}
     
     def _load_variants(self):
         """Load Kima Hebrew variants"""
@@ -81,16 +172,15 @@ class KimaGazetteer:
             print(f"  [WARNING] Kima variants file not found: {file_path}")
             return
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                variant = row['variant']
-                place_id = row['PlaceId']
-                
-                # Look up canonical name from place_id
-                if place_id in self.place_id_index:
-                    canonical = self.place_id_index[place_id]
-                    self.variants[variant] = canonical
+        for variant, place_id in _iter_tsv_rows(file_path, ['variant', 'PlaceId']):
+            if variant is None:  # short row
+                continue
+            variant = sys.intern(variant)
+            
+            # Look up canonical name from place_id
+            if place_id in self.place_id_index:
+                canonical = self.place_id_index[place_id]
+                self.variants[variant] = canonical
     
     def _load_maagarim_forms(self):
         """Load Maagarim textual forms"""
@@ -100,16 +190,15 @@ class KimaGazetteer:
             print(f"  [WARNING] Maagarim forms file not found: {file_path}")
             return
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            for row in reader:
-                canonical = row['word']  # EREKH (canonical value)
-                textual_form = row['ZURA']  # ZURA (textual form)
-                
-                # Store mapping
-                self.textual_forms[textual_form] = canonical
+        for word, zura in _iter_tsv_rows(file_path, ['word', 'ZURA']):
+            if word is None or zura is None:  # short row
+                continue
+            canonical = sys.intern(word)  # EREKH (canonical value)
+            textual_form = sys.intern(zura)  # ZURA (textual form)
+            
+            # Store mapping
+            self.textual_forms[textual_form] = canonical
     
-    @lru_cache(maxsize=10000)
     def lookup(self, text: str) -> Optional[dict]:
         """
         Unified lookup with cascading fallback
@@ -126,31 +215,38 @@ class KimaGazetteer:
         Returns:
             Place data dict or None if not found
         """
-        # 1. Direct match in master gazetteer
-        if text in self.places:
-            return self.places[text]
-        
-        # 2. Textual form match (handles prefixed forms from Maagarim)
-        if text in self.textual_forms:
-            canonical = self.textual_forms[text]
-            if canonical in self.places:
-                return self.places[canonical]
-        
-        # 3. Variant name match
-        if text in self.variants:
-            canonical = self.variants[text]
-            if canonical in self.places:
-                return self.places[canonical]
-        
-        # 4. Prefix stripping fallback (existing logic)
-        stripped = self._strip_prefixes(text)
-        if stripped != text:
-            # Try again with stripped version (recursive)
-            result = self.lookup(stripped)
-            if result:
-                return result
-        
-        return None
+        # 1. Direct match in master gazetteer (a dict hit, kept out of the cache)
+        row = self.place_rows.get(text)
+        if row is not None:
+            return self._place_data(row)
+        
+        return self._lookup_fallback(text)
+    
+    @lru_cache(maxsize=LOOKUP_CACHE_SIZE)
+    def _lookup_fallback(self, text: str) -> Optional[dict]:
+        """Steps 2-4 of lookup() for text that is not a canonical name"""
+        place_rows = self.place_rows
+        candidate = text
+        while True:
+            # 2. Textual form match (handles prefixed forms from Maagarim)
+            canonical = self.textual_forms.get(candidate)
+            if canonical in place_rows:
+                return self._place_data(place_rows[canonical])
+            
+            # 3. Variant name match
+            canonical = self.variants.get(candidate)
+            if canonical in place_rows:
+                return self._place_data(place_rows[canonical])
+            
+            # 4. Prefix stripping fallback: retry steps 1-3 on the stripped text
+            stripped = self._strip_prefixes(candidate)
+            if stripped == candidate:
+                return None
+            candidate = stripped
+            
+            row = place_rows.get(candidate)
+            if row is not None:
+                return self._place_data(row)
     
     def _strip_prefixes(self, text: str) -> str:
         """
@@ -177,12 +273,15 @@ class KimaGazetteer:
         
         Returns:
             Frozenset containing all known place names and variants
+            (built on the first call; the gazetteer does not change after loading)
         """
-        all_names = set()
-        all_names.update(self.places.keys())
-        all_names.update(self.variants.keys())
-        all_names.update(self.textual_forms.keys())
-        return frozenset(all_names)
+        if self._all_names is None:
+            all_names = set()
+            all_names.update(self.place_rows.keys())
+            all_names.update(self.variants.keys())
+            all_names.update(self.textual_forms.keys())
+            self._all_names = frozenset(all_names)
+        return self._all_names
     
     def get_statistics(self) -> dict:
         """
@@ -191,17 +290,27 @@ class KimaGazetteer:
         Returns:
             Dict with counts and coverage percentages
         """
-        total = len(self.places)
+        total = len(self.place_rows)
+        
+        # Count over whole columns unless repeated names left superseded rows
+        if total == len(self.place_columns['id']):
+            columns = self.place_columns
+        else:
+            rows = sorted(self.place_rows.values())
+            columns = {
+                key: [self.place_columns[key][row] for row in rows]
+                for key in ('viaf', 'geonames', 'wikidata', 'lat', 'lon')
+            }
         
         return {
             'total_places': total,
             'total_variants': len(self.variants),
             'total_textual_forms': len(self.textual_forms),
             'total_lookups': total + len(self.variants) + len(self.textual_forms),
-            'places_with_viaf': sum(1 for p in self.places.values() if p['viaf']),
-            'places_with_geonames': sum(1 for p in self.places.values() if p['geonames']),
-            'places_with_wikidata': sum(1 for p in self.places.values() if p['wikidata']),
-            'places_with_coords': sum(1 for p in self.places.values() if p['lat'] and p['lon']),
+            'places_with_viaf': sum(map(bool, columns['viaf'])),
+            'places_with_geonames': sum(map(bool, columns['geonames'])),
+            'places_with_wikidata': sum(map(bool, columns['wikidata'])),
+            'places_with_coords': sum(1 for lat, lon in zip(columns['lat'], columns['lon']) if lat and lon),
         }
 
 
@@ -3,12 +3,18 @@ Domain Models - Immutable Data Structures
 Following functional programming principles with dataclasses
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
 
+# Records are slotted (no per-instance __dict__) where dataclasses allow it;
+# frozen slotted dataclasses only pickle reliably from Python 3.11
+RECORD_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 11) else {"frozen": True}
+
+
 class EntityType(Enum):
     """Types of extracted entities"""
     DATE = "date"
@@ -32,7 +38,7 @@ class EventClass(Enum):
     REFERENCE_EVENT = "Reference_Event"
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class ExtractedEntity:
     """Immutable representation of an extracted entity"""
     value: str
@@ -47,11 +53,11 @@ class ExtractedEntity:
         """Validate entity data"""
         if not 0 <= self.confidence <= 1:
             raise ValueError("Confidence must be between 0 and 1")
-        if not self.value.strip():
+        if not self.value or self.value.isspace():
             raise ValueError("Entity value cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class ClassifiedEntity:
     """Entity with classification label"""
     entity: ExtractedEntity
@@ -67,7 +73,7 @@ class ClassifiedEntity:
         return self.entity.entity_type
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class ColophonInfo:
     """Structured colophon information"""
     text: str
@@ -78,10 +84,10 @@ class ColophonInfo:
     
     @property
     def is_valid(self) -> bool:
-        return bool(self.text.strip())
+        return bool(self.text) and not self.text.isspace()
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Person:
     """Representation of a person (scribe, author, etc.)"""
     name: str
@@ -97,7 +103,7 @@ class Person:
         return self.name
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Place:
     """Representation of a geographic location"""
     name: str
@@ -107,7 +113,7 @@ class Place:
     coordinates: Optional[tuple[float, float]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Work:
     """Representation of an intellectual work (F1_Work)"""
     title: str
@@ -116,7 +122,7 @@ class Work:
     subject: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Expression:
     """Specific version of a work (F2_Expression)"""
     work: Work
@@ -124,7 +130,7 @@ class Expression:
     language: str = "Hebrew"
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Event:
     """Structured event following CIDOC-CRM"""
     event_type: str
@@ -144,7 +150,7 @@ class Event:
         return self.place is not None
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Manuscript:
     """Complete manuscript record (F4_Manifestation_Singleton)"""
     manuscript_id: str
@@ -185,7 +191,7 @@ class Manuscript:
                 if e.event_class in (EventClass.E12_PRODUCTION, EventClass.F32_ITEM_PRODUCTION)]
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class ExtractionResult:
     """Complete extraction results for processing pipeline"""
     manuscripts: List[Manuscript]
@@ -207,7 +213,7 @@ class ExtractionResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(**RECORD_OPTIONS)
 class Config:
     """Application configuration - immutable"""
     # Paths
@@ -221,6 +227,8 @@ class Config:
     use_grok: bool = True
     ai_only: bool = False  # Use AI for extraction instead of regex patterns
     use_kima: bool = False  # Use Kima/Maagarim gazetteer for locations
+    extraction_workers: int = 1  # Worker processes for regex entity extraction (1 = in-process, 0 = one per CPU)
+    output_workers: int = 1  # Worker processes for CSV row formatting and RDF building (1 = in-process, 0 = one per CPU)
     
     # API
     grok_api_key: Optional[str] = None
@@ -228,6 +236,7 @@ class Config:
     grok_chunk_size: int = 8
     grok_retries: int = 3
     grok_timeout: int = 35
+    grok_batch_size: int = 1  # Manuscripts per Grok classification request (1 = one manuscript per request)
     
     # Ontology namespaces
     base_namespace: str = "http://data.hebrewmanuscripts.org/"
@@ -4,9 +4,11 @@ Pure transformations: Data → RDF Triples
 Following CIDOC-CRM and LRMoo ontology standards
 """
 
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from collections import Counter
 from functools import lru_cache
 from urllib.parse import quote
+import re
 
 try:
     from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, XSD
@@ -18,7 +20,7 @@ except ImportError:
 
 from ..models.entities import (
     Manuscript, Event, Person, Place, Work, Expression,
-    ColophonInfo, ClassifiedEntity, EventClass
+    ColophonInfo, ClassifiedEntity, EntityType, EventClass
 )
 
 
@@ -29,6 +31,25 @@ from ..models.entities import (
 class OntologyNamespaces:
     """Immutable namespace configuration"""
     
+    # Terms used by RDFGraphBuilder, set once as attributes (e.g. ns.E21_Person)
+    # so building a triple does not go through a Namespace lookup
+    CRM_TERMS = (
+        'E12_Production', 'E21_Person', 'E52_Time_Span', 'E53_Place',
+        'E73_Information_Object', 'P14_carried_out_by', 'P1_is_identified_by',
+        'P4_has_time_span', 'P72_has_language', 'P7_took_place_at',
+    )
+    LRMOO_TERMS = (
+        'F1_Work', 'F2_Expression', 'F32_Item_Production_Event',
+        'F4_Manifestation_Singleton', 'R27_materialized', 'R3_is_realised_in',
+        'R4_embodies',
+    )
+    HM_TERMS = (
+        'Codicological_Unit', 'Colophon', 'Hebrew', 'colophon_text',
+        'external_uri_geonames', 'external_uri_nli', 'external_uri_wikidata',
+        'has_author', 'has_colophon', 'has_role', 'has_scribe', 'has_title', 'latitude',
+        'longitude', 'mentions_scribe', 'modern_name',
+    )
+    
     def __init__(self, config):
         if not RDF_AVAILABLE:
             return
@@ -39,6 +60,39 @@ class OntologyNamespaces:
         self.LRMOO = Namespace(config.lrmoo_namespace)
         self.NLI = Namespace("http://nli.org.il/he/authorities/")
         self.WD = Namespace("http://www.wikidata.org/entity/")
+        
+        for namespace, names in ((self.CRM, self.CRM_TERMS), (self.LRMOO, self.LRMOO_TERMS), (self.HM, self.HM_TERMS)):
+            for name in names:
+                setattr(self, name, namespace[name])
+        
+        # N-Triples forms of the terms, which is what the builder's triples
+        # hold: the fixed terms up front (n3), names only known at run time
+        # (ontology mappings, event classes) cached as they come
+        self._crm_n3 = {name: iri_to_n3(self.CRM[name]) for name in self.CRM_TERMS}
+        self._lrmoo_n3 = {name: iri_to_n3(self.LRMOO[name]) for name in self.LRMOO_TERMS}
+        self._hm_n3 = {name: iri_to_n3(self.HM[name]) for name in self.HM_TERMS}
+        self.n3 = {**self._crm_n3, **self._lrmoo_n3, **self._hm_n3}
+    
+    def crm(self, name: str) -> str:
+        """N-Triples form of a CIDOC-CRM term (cached)"""
+        term = self._crm_n3.get(name)
+        if term is None:
+            term = self._crm_n3[name] = iri_to_n3(self.CRM[name])
+        return term
+    
+    def lrmoo(self, name: str) -> str:
+        """N-Triples form of an LRMoo term (cached)"""
+        term = self._lrmoo_n3.get(name)
+        if term is None:
+            term = self._lrmoo_n3[name] = iri_to_n3(self.LRMOO[name])
+        return term
+    
+    def hm(self, name: str) -> str:
+        """N-Triples form of a Hebrew Manuscripts ontology term (cached)"""
+        term = self._hm_n3.get(name)
+        if term is None:
+            term = self._hm_n3[name] = iri_to_n3(self.HM[name])
+        return term
     
     def bind_to_graph(self, graph: 'Graph') -> None:
         """Bind namespaces to RDF graph"""
@@ -51,29 +105,63 @@ class OntologyNamespaces:
         graph.bind("lrmoo", self.LRMOO)
         graph.bind("nli", self.NLI)
         graph.bind("dcterms", DCTERMS)
+    
+    def prefixes(self) -> Dict[str, str]:
+        """Prefix → namespace IRI, as written in Turtle output"""
+        if not RDF_AVAILABLE:
+            return {}
+        
+        return {
+            "base": str(self.BASE),
+            "hm": str(self.HM),
+            "crm": str(self.CRM),
+            "lrmoo": str(self.LRMOO),
+            "nli": str(self.NLI),
+            "dcterms": str(DCTERMS),
+            "rdf": str(RDF),
+            "rdfs": str(RDFS),
+            "xsd": str(XSD),
+        }
 
 
 # ============================================================================
 # URI GENERATION - Pure Functions
 # ============================================================================
 
+# Memoized results per URI function (normalize_for_uri, create_*_uri); sized
+# for the distinct ids, names, places and dates of a full catalogue run
+URI_CACHE_SIZE = 65536
+
+# Text made only of characters quote() leaves as they are (already URI-safe)
+_URI_SAFE_TEXT = re.compile(r'[A-Za-z0-9_.\-~]+')
+
+
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def normalize_for_uri(text: str) -> str:
     """Pure function: Normalize text for URI component with URL encoding"""
-    # First do basic normalization
-    normalized = text.strip().replace(" ", "_").replace("בן", "ben").replace('"', '').replace("'", '')
+    stripped = text.strip()
+    # Already-safe text (e.g. numeric manuscript ids) comes out unchanged
+    if _URI_SAFE_TEXT.fullmatch(stripped):
+        return stripped
+    
+    # First do basic normalization. Kept as a replace chain: a replace with
+    # nothing to replace returns the string as is, while str.translate maps
+    # Hebrew text char by char through the table (over 10x slower here).
+    # Quotes go after "בן" so that removing them cannot create a "בן".
+    normalized = stripped.replace(" ", "_").replace("בן", "ben").replace('"', '').replace("'", '')
     # Then URL-encode to handle Hebrew and other non-ASCII characters
     # safe='_' keeps underscores unencoded
     return quote(normalized, safe='_')
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_manuscript_uri(base: str, manuscript_id: str) -> str:
     """Pure function: Create URI for manuscript"""
     clean_id = normalize_for_uri(manuscript_id)
     return f"{base}MS_{clean_id}"
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_event_uri(base: str, manuscript_id: str, event_type: str, index: int = 0) -> str:
     """Pure function: Create URI for event"""
     clean_id = normalize_for_uri(manuscript_id)
@@ -82,21 +170,21 @@ def create_event_uri(base: str, manuscript_id: str, event_type: str, index: int
     return f"{base}MS_{clean_id}_{clean_type}_Event{suffix}"
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_person_uri(base: str, person_name: str) -> str:
     """Pure function: Create URI for person"""
     clean_name = normalize_for_uri(person_name)
     return f"{base}Person_{clean_name}"
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_place_uri(base: str, place_name: str) -> str:
     """Pure function: Create URI for place"""
     clean_name = normalize_for_uri(place_name)
     return f"{base}Place_{clean_name}"
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_timespan_uri(base: str, date_value: str) -> str:
     """Pure function: Create URI for timespan"""
     # Normalize and URL-encode to handle Hebrew dates and special characters
@@ -104,13 +192,14 @@ def create_timespan_uri(base: str, date_value: str) -> str:
     return f"{base}TimeSpan_{clean_date}"
 
 
-@lru_cache(maxsize=1000)
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_work_uri(base: str, work_title: str) -> str:
     """Pure function: Create URI for work"""
     clean_title = normalize_for_uri(work_title)
     return f"{base}Work_{clean_title}"
 
 
+@lru_cache(maxsize=URI_CACHE_SIZE)
 def create_expression_uri(base: str, work_title: str, manuscript_id: str) -> str:
     """Pure function: Create URI for expression"""
     clean_title = normalize_for_uri(work_title)
@@ -118,6 +207,165 @@ def create_expression_uri(base: str, work_title: str, manuscript_id: str) -> str
     return f"{base}Expression_{clean_title}_MS_{clean_id}"
 
 
+@lru_cache(maxsize=URI_CACHE_SIZE)
+def uri_ref(uri: str) -> 'URIRef':
+    """URIRef for a generated URI, shared between repeats (validated once)"""
+    return URIRef(uri)
+
+
+# ============================================================================
+# TRIPLE SERIALIZATION - Pure Functions
+# ============================================================================
+
+# Characters not allowed in an N-Triples/Turtle IRI (written as \u escapes)
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+# Turtle local names that can be written as prefix:name (others keep the full IRI)
+_LOCAL_NAME = re.compile(r'(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2})(?:[A-Za-z0-9_.\-]|%[0-9A-Fa-f]{2})*(?<!\.)')
+
+_RDF_TYPE_N3 = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+_RDFS_LABEL_N3 = "<http://www.w3.org/2000/01/rdf-schema#label>"
+_XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+_XSD_DECIMAL = "http://www.w3.org/2001/XMLSchema#decimal"
+
+
+def iri_to_n3(iri: str) -> str:
+    """Pure function: N-Triples form of an IRI"""
+    if _IRI_UNSAFE.search(iri):
+        iri = _IRI_UNSAFE.sub(lambda match: f"\\u{ord(match.group()):04X}", iri)
+    return f"<{iri}>"
+
+
+def literal_to_n3(value, lang: Optional[str] = None, datatype: Optional[str] = None) -> str:
+    """
+    Pure function: N-Triples form of a literal (also valid Turtle)
+    
+    Args:
+        value: Literal value (its str() is the lexical form)
+        lang: Language tag
+        datatype: Datatype IRI (ignored when lang is given)
+    
+    Returns:
+        Quoted, escaped literal with its language or datatype suffix
+    """
+    text = (
+        str(value).replace('\\', '\\\\').replace('"', '\\"')
+        .replace('\n', '\\n').replace('\r', '\\r')
+    )
+    if lang:
+        return f'"{text}"@{lang}'
+    if datatype:
+        return f'"{text}"^^{iri_to_n3(datatype)}'
+    return f'"{text}"'
+
+
+# Memoized literals for values that recur across manuscripts (names, roles,
+# titles); one-off labels such as "Manuscript <id>" use literal_to_n3 directly
+@lru_cache(maxsize=URI_CACHE_SIZE)
+def he_literal(text: str) -> str:
+    """Pure function: N-Triples form of a Hebrew (@he) literal"""
+    return literal_to_n3(text, "he")
+
+
+@lru_cache(maxsize=URI_CACHE_SIZE)
+def en_literal(text: str) -> str:
+    """Pure function: N-Triples form of an English (@en) literal"""
+    return literal_to_n3(text, "en")
+
+
+class FastTripleWriter:
+    """
+    Plain triple store: N-Triples strings in a set, written out as sorted
+    N-Triples or as Turtle grouped by subject
+    
+    Holds nothing but the triples (no rdflib indices), which is all that
+    serialization and counting need.
+    """
+    
+    FORMATS = frozenset({'turtle', 'ttl', 'nt', 'ntriples'})
+    
+    def __init__(self, prefixes: Dict[str, str]):
+        self.prefixes = prefixes
+        self.triples: Set[Tuple[str, str, str]] = set()
+    
+    def __len__(self) -> int:
+        return len(self.triples)
+    
+    def add(self, s: str, p: str, o: str) -> None:
+        """Add a triple of N-Triples terms (see iri_to_n3, literal_to_n3)"""
+        self.triples.add((s, p, o))
+    
+    def lines(self, format: str = 'turtle', sort: bool = True) -> Iterator[str]:
+        """
+        Yield the serialized document line by line
+        
+        Args:
+            format: 'turtle'/'ttl' or 'nt'/'ntriples'
+            sort: Write N-Triples in sorted order (for stable files; a parser
+                  does not need it). Turtle is always sorted, to group subjects.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Unsupported format for FastTripleWriter: {format}")
+        
+        if format in ('nt', 'ntriples'):
+            for s, p, o in (sorted(self.triples) if sort else self.triples):
+                yield f"{s} {p} {o} .\n"
+            return
+        
+        for prefix, namespace in self.prefixes.items():
+            yield f"@prefix {prefix}: <{namespace}> .\n"
+        
+        names, name = self._turtle_namer()
+        known = names.get
+        subject = None
+        for s, p, o in sorted(self.triples):
+            # Predicates and ontology terms are almost always known already;
+            # "a" stands for rdf:type only in predicate position
+            p = "a" if p == _RDF_TYPE_N3 else known(p) or name(p)
+            o = known(o) or name(o)
+            if s != subject:
+                if subject is not None:
+                    yield " .\n"
+                yield f"\n{name(s)} {p} {o}"
+                subject = s
+            else:
+                yield f" ;\n    {p} {o}"
+        if subject is not None:
+            yield " .\n"
+    
+    def serialize(self, format: str = 'turtle', sort: bool = True) -> str:
+        """Serialize all triples to a string (see lines())"""
+        return "".join(self.lines(format, sort))
+    
+    def _turtle_namer(self):
+        """Return the N-Triples → Turtle term memo and the function that fills it"""
+        namespaces = sorted(
+            ((f"<{namespace}", prefix) for prefix, namespace in self.prefixes.items()),
+            key=lambda item: len(item[0]), reverse=True
+        )
+        names = {}
+        
+        def name(term: str) -> str:
+            short = names.get(term)
+            if short is None:
+                short = term
+                if term[0] == '<':
+                    for start, prefix in namespaces:
+                        if term.startswith(start):
+                            local = term[len(start):-1]
+                            if _LOCAL_NAME.fullmatch(local):
+                                short = f"{prefix}:{local}"
+                            break
+                elif term[-1] == '>':
+                    # Typed literal: shorten the datatype IRI
+                    split = term.rindex('^^<') + 2
+                    short = term[:split] + name(term[split:])
+                names[term] = short
+            return short
+        
+        return names, name
+
+
 # ============================================================================
 # RDF GRAPH BUILDER - Functional Approach
 # ============================================================================
@@ -132,88 +380,164 @@ class RDFGraphBuilder:
         if not RDF_AVAILABLE:
             raise ImportError("rdflib is required for RDF generation")
         
-        self.graph = Graph()
         self.ns = OntologyNamespaces(config)
-        self.ns.bind_to_graph(self.graph)
         self.base_uri = config.base_namespace
+        
+        # Triples are emitted here as N-Triples strings (no rdflib terms) and
+        # moved to the writer in batches. Turtle and N-Triples are written by
+        # the writer itself; an rdflib Graph is only built when asked for
+        # (graph, other formats). The add_* methods still return URIRefs.
+        self._pending: List[Tuple[str, str, str]] = []
+        self.writer = FastTripleWriter(self.ns.prefixes())
+        self._graph: Optional['Graph'] = None
+        self._graph_size = 0
+        
+        # Persons, places and time-spans already emitted (→ their URI), so a
+        # repeat (same scribe or place across events and manuscripts) costs
+        # a lookup instead of re-emitting its triples. Keyed on the whole
+        # record: the same name with another role still adds its triples.
+        self._emitted_persons: Dict[Person, URIRef] = {}
+        self._emitted_places: Dict[Place, URIRef] = {}
+        self._emitted_timespans: Dict[str, str] = {}
+        
+        # Event class / property name → N-Triples term (LRMoo for F classes
+        # and R properties, CIDOC-CRM otherwise)
+        self._class_n3: Dict[str, str] = {}
+        self._property_n3: Dict[str, str] = {}
+    
+    @property
+    def graph(self) -> 'Graph':
+        """rdflib Graph of all triples added so far (built on demand)"""
+        self.flush()
+        if self._graph is None or self._graph_size != len(self.writer):
+            graph = Graph()
+            self.ns.bind_to_graph(graph)
+            # The triples already are N-Triples: one unsorted pass for rdflib
+            graph.parse(data=self.writer.serialize('nt', sort=False), format='nt')
+            self._graph = graph
+            self._graph_size = len(self.writer)
+        return self._graph
+    
+    def flush(self) -> None:
+        """Move the pending triples to the writer"""
+        if self._pending:
+            self.writer.triples.update(self._pending)
+            self._pending.clear()
+    
+    def add_triples(self, triples: Iterable[Tuple[str, str, str]]) -> None:
+        """Add N-Triples term tuples built elsewhere (e.g. by another builder's writer)"""
+        self.flush()
+        self.writer.triples.update(triples)
+    
+    def _event_class(self, name: str) -> str:
+        """N-Triples term of an event class (F... in LRMoo, else CIDOC-CRM)"""
+        term = self._class_n3.get(name)
+        if term is None:
+            term = self.ns.lrmoo(name) if name.startswith("F") else self.ns.crm(name)
+            self._class_n3[name] = term
+        return term
+    
+    def _manuscript_property(self, name: str) -> str:
+        """N-Triples term of an event → manuscript property (R... in LRMoo, else CIDOC-CRM)"""
+        term = self._property_n3.get(name)
+        if term is None:
+            term = self.ns.lrmoo(name) if name.startswith("R") else self.ns.crm(name)
+            self._property_n3[name] = term
+        return term
     
     def add_manuscript(self, manuscript: Manuscript) -> URIRef:
         """Add manuscript as F4_Manifestation_Singleton"""
-        ms_uri = URIRef(create_manuscript_uri(self.base_uri, manuscript.manuscript_id))
+        ms_iri = create_manuscript_uri(self.base_uri, manuscript.manuscript_id)
+        ms = iri_to_n3(ms_iri)
+        n3 = self.ns.n3
+        emit = self._pending.append
         
         # Type assertions
-        self.graph.add((ms_uri, RDF.type, self.ns.LRMOO.F4_Manifestation_Singleton))
-        self.graph.add((ms_uri, RDF.type, self.ns.HM.Codicological_Unit))
+        emit((ms, _RDF_TYPE_N3, n3["F4_Manifestation_Singleton"]))
+        emit((ms, _RDF_TYPE_N3, n3["Codicological_Unit"]))
         
         # Identifier
-        self.graph.add((ms_uri, self.ns.CRM.P1_is_identified_by, 
-                       Literal(manuscript.manuscript_id, datatype=XSD.string)))
+        emit((ms, n3["P1_is_identified_by"], literal_to_n3(manuscript.manuscript_id, datatype=_XSD_STRING)))
         
         # Labels
-        self.graph.add((ms_uri, RDFS.label, 
-                       Literal(f"Manuscript {manuscript.manuscript_id}", lang="en")))
-        self.graph.add((ms_uri, RDFS.label, 
-                       Literal(f"כתב יד {manuscript.manuscript_id}", lang="he")))
+        emit((ms, _RDFS_LABEL_N3, literal_to_n3(f"Manuscript {manuscript.manuscript_id}", "en")))
+        emit((ms, _RDFS_LABEL_N3, literal_to_n3(f"כתב יד {manuscript.manuscript_id}", "he")))
         
         # Add NLI URI if present
         if manuscript.nli_uri:
-            self.graph.add((ms_uri, self.ns.HM.external_uri_nli, 
-                           URIRef(manuscript.nli_uri)))
+            emit((ms, n3["external_uri_nli"], iri_to_n3(manuscript.nli_uri)))
         
-        return ms_uri
+        return uri_ref(ms_iri)
     
     def add_person(self, person: Person) -> URIRef:
         """Add person as E21_Person"""
-        person_uri = URIRef(create_person_uri(self.base_uri, person.full_name))
+        person_uri = self._emitted_persons.get(person)
+        if person_uri is not None:
+            return person_uri
         
-        self.graph.add((person_uri, RDF.type, self.ns.CRM.E21_Person))
-        self.graph.add((person_uri, RDFS.label, 
-                       Literal(person.full_name, lang="he")))
+        person_iri = create_person_uri(self.base_uri, person.full_name)
+        subject = iri_to_n3(person_iri)
+        n3 = self.ns.n3
+        emit = self._pending.append
+        
+        emit((subject, _RDF_TYPE_N3, n3["E21_Person"]))
+        emit((subject, _RDFS_LABEL_N3, he_literal(person.full_name)))
         
         # Add role if specified
         if person.role:
-            self.graph.add((person_uri, self.ns.HM.has_role, 
-                           Literal(person.role, lang="en")))
+            emit((subject, n3["has_role"], en_literal(person.role)))
         
         # Add external URIs
         if person.nli_uri:
-            self.graph.add((person_uri, self.ns.HM.external_uri_nli, 
-                           URIRef(person.nli_uri)))
+            emit((subject, n3["external_uri_nli"], iri_to_n3(person.nli_uri)))
         if person.wikidata_uri:
-            self.graph.add((person_uri, self.ns.HM.external_uri_wikidata, 
-                           URIRef(person.wikidata_uri)))
+            emit((subject, n3["external_uri_wikidata"], iri_to_n3(person.wikidata_uri)))
         
+        person_uri = self._emitted_persons[person] = uri_ref(person_iri)
         return person_uri
     
     def add_place(self, place: Place) -> URIRef:
         """Add place as E53_Place"""
-        place_uri = URIRef(create_place_uri(self.base_uri, place.name))
+        place_uri = self._emitted_places.get(place)
+        if place_uri is not None:
+            return place_uri
+        
+        place_iri = create_place_uri(self.base_uri, place.name)
+        subject = iri_to_n3(place_iri)
+        n3 = self.ns.n3
+        emit = self._pending.append
         
-        self.graph.add((place_uri, RDF.type, self.ns.CRM.E53_Place))
-        self.graph.add((place_uri, RDFS.label, Literal(place.name, lang="he")))
+        emit((subject, _RDF_TYPE_N3, n3["E53_Place"]))
+        emit((subject, _RDFS_LABEL_N3, he_literal(place.name)))
         
         if place.modern_name:
-            self.graph.add((place_uri, self.ns.HM.modern_name, 
-                           Literal(place.modern_name, lang="en")))
+            emit((subject, n3["modern_name"], en_literal(place.modern_name)))
         
         # Add external URIs
         if place.nli_uri:
-            self.graph.add((place_uri, self.ns.HM.external_uri_nli, 
-                           URIRef(place.nli_uri)))
+            emit((subject, n3["external_uri_nli"], iri_to_n3(place.nli_uri)))
         if place.geonames_uri:
-            self.graph.add((place_uri, self.ns.HM.external_uri_geonames, 
-                           URIRef(place.geonames_uri)))
+            emit((subject, n3["external_uri_geonames"], iri_to_n3(place.geonames_uri)))
         
         # Add coordinates if present
         if place.coordinates:
             lat, lon = place.coordinates
-            self.graph.add((place_uri, self.ns.HM.latitude, 
-                           Literal(lat, datatype=XSD.decimal)))
-            self.graph.add((place_uri, self.ns.HM.longitude, 
-                           Literal(lon, datatype=XSD.decimal)))
+            emit((subject, n3["latitude"], literal_to_n3(lat, datatype=_XSD_DECIMAL)))
+            emit((subject, n3["longitude"], literal_to_n3(lon, datatype=_XSD_DECIMAL)))
         
+        place_uri = self._emitted_places[place] = uri_ref(place_iri)
         return place_uri
     
+    def _add_timespan(self, date: str) -> str:
+        """Add E52_Time_Span for a date; returns its N-Triples IRI"""
+        timespan = self._emitted_timespans.get(date)
+        if timespan is None:
+            timespan = iri_to_n3(create_timespan_uri(self.base_uri, date))
+            self._pending.append((timespan, _RDF_TYPE_N3, self.ns.n3["E52_Time_Span"]))
+            self._pending.append((timespan, _RDFS_LABEL_N3, literal_to_n3(date)))
+            self._emitted_timespans[date] = timespan
+        return timespan
+    
     def add_production_event(
         self,
         manuscript_uri: URIRef,
@@ -223,42 +547,42 @@ class RDFGraphBuilder:
         scribe: Optional[Person] = None
     ) -> URIRef:
         """Add E12_Production event"""
-        event_uri = URIRef(create_event_uri(
+        event_iri = create_event_uri(
             self.base_uri, 
             manuscript.manuscript_id, 
             "Production"
-        ))
+        )
+        event = iri_to_n3(event_iri)
+        ms = iri_to_n3(manuscript_uri)
+        n3 = self.ns.n3
+        emit = self._pending.append
         
         # Event types
-        self.graph.add((event_uri, RDF.type, self.ns.CRM.E12_Production))
-        self.graph.add((event_uri, RDF.type, self.ns.LRMOO.F32_Item_Production_Event))
+        emit((event, _RDF_TYPE_N3, n3["E12_Production"]))
+        emit((event, _RDF_TYPE_N3, n3["F32_Item_Production_Event"]))
         
         # Link to manuscript
-        self.graph.add((event_uri, self.ns.LRMOO.R27_materialized, manuscript_uri))
+        emit((event, n3["R27_materialized"], ms))
         
         # Add temporal info
         if date:
-            timespan_uri = URIRef(create_timespan_uri(self.base_uri, date))
-            self.graph.add((timespan_uri, RDF.type, self.ns.CRM.E52_Time_Span))
-            self.graph.add((timespan_uri, RDFS.label, Literal(date)))
-            self.graph.add((event_uri, self.ns.CRM.P4_has_time_span, timespan_uri))
+            emit((event, n3["P4_has_time_span"], self._add_timespan(date)))
         
         # Add spatial info
         if place:
             place_uri = self.add_place(place)
-            self.graph.add((event_uri, self.ns.CRM.P7_took_place_at, place_uri))
+            emit((event, n3["P7_took_place_at"], iri_to_n3(place_uri)))
         
         # Add actor (scribe)
         if scribe:
-            scribe_uri = self.add_person(scribe)
-            self.graph.add((event_uri, self.ns.CRM.P14_carried_out_by, scribe_uri))
-            self.graph.add((manuscript_uri, self.ns.HM.has_scribe, scribe_uri))
+            scribe_n3 = iri_to_n3(self.add_person(scribe))
+            emit((event, n3["P14_carried_out_by"], scribe_n3))
+            emit((ms, n3["has_scribe"], scribe_n3))
         
         # Label
-        self.graph.add((event_uri, RDFS.label, 
-                       Literal(f"Production of MS {manuscript.manuscript_id}", lang="en")))
+        emit((event, _RDFS_LABEL_N3, literal_to_n3(f"Production of MS {manuscript.manuscript_id}", "en")))
         
-        return event_uri
+        return uri_ref(event_iri)
     
     def add_colophon(
         self,
@@ -268,25 +592,27 @@ class RDFGraphBuilder:
     ) -> URIRef:
         """Add colophon as E73_Information_Object"""
         clean_id = normalize_for_uri(manuscript.manuscript_id)
-        colophon_uri = URIRef(f"{self.base_uri}MS_{clean_id}_Colophon")
+        colophon_iri = f"{self.base_uri}MS_{clean_id}_Colophon"
+        subject = iri_to_n3(colophon_iri)
+        n3 = self.ns.n3
+        emit = self._pending.append
         
         # Types
-        self.graph.add((colophon_uri, RDF.type, self.ns.HM.Colophon))
-        self.graph.add((colophon_uri, RDF.type, self.ns.CRM.E73_Information_Object))
+        emit((subject, _RDF_TYPE_N3, n3["Colophon"]))
+        emit((subject, _RDF_TYPE_N3, n3["E73_Information_Object"]))
         
         # Link to manuscript
-        self.graph.add((manuscript_uri, self.ns.HM.has_colophon, colophon_uri))
+        emit((iri_to_n3(manuscript_uri), n3["has_colophon"], subject))
         
         # Add text
-        self.graph.add((colophon_uri, self.ns.HM.colophon_text, 
-                       Literal(colophon.text, lang="he")))
+        emit((subject, n3["colophon_text"], literal_to_n3(colophon.text, "he")))
         
         # Link to scribe if mentioned
         if colophon.scribe_name:
-            scribe_uri = URIRef(create_person_uri(self.base_uri, colophon.scribe_name))
-            self.graph.add((colophon_uri, self.ns.HM.mentions_scribe, scribe_uri))
+            scribe = iri_to_n3(create_person_uri(self.base_uri, colophon.scribe_name))
+            emit((subject, n3["mentions_scribe"], scribe))
         
-        return colophon_uri
+        return uri_ref(colophon_iri)
     
     def add_work_expression_manifestation(
         self,
@@ -295,38 +621,43 @@ class RDFGraphBuilder:
         work: Work
     ) -> Tuple[URIRef, URIRef]:
         """Create Work → Expression → Manifestation hierarchy"""
+        n3 = self.ns.n3
+        emit = self._pending.append
         
         # Create Work (F1_Work)
-        work_uri = URIRef(create_work_uri(self.base_uri, work.title))
-        self.graph.add((work_uri, RDF.type, self.ns.LRMOO.F1_Work))
-        self.graph.add((work_uri, RDFS.label, Literal(work.title, lang="he")))
-        self.graph.add((work_uri, self.ns.HM.has_title, Literal(work.title, lang="he")))
+        work_iri = create_work_uri(self.base_uri, work.title)
+        work_n3 = iri_to_n3(work_iri)
+        title = he_literal(work.title)
+        emit((work_n3, _RDF_TYPE_N3, n3["F1_Work"]))
+        emit((work_n3, _RDFS_LABEL_N3, title))
+        emit((work_n3, n3["has_title"], title))
         
         # Link author
         if work.author:
             author_uri = self.add_person(work.author)
-            self.graph.add((work_uri, self.ns.HM.has_author, author_uri))
+            emit((work_n3, n3["has_author"], iri_to_n3(author_uri)))
         
         # Create Expression (F2_Expression)
-        expression_uri = URIRef(create_expression_uri(
+        expression_iri = create_expression_uri(
             self.base_uri, 
             work.title, 
             manuscript.manuscript_id
-        ))
+        )
+        expression = iri_to_n3(expression_iri)
         
-        self.graph.add((expression_uri, RDF.type, self.ns.LRMOO.F2_Expression))
-        self.graph.add((expression_uri, self.ns.LRMOO.R3_is_realised_in, work_uri))
-        self.graph.add((expression_uri, RDFS.label, 
-                       Literal(f"{work.title} - Expression in MS {manuscript.manuscript_id}", lang="en")))
+        emit((expression, _RDF_TYPE_N3, n3["F2_Expression"]))
+        emit((expression, n3["R3_is_realised_in"], work_n3))
+        emit((expression, _RDFS_LABEL_N3,
+              literal_to_n3(f"{work.title} - Expression in MS {manuscript.manuscript_id}", "en")))
         
         # Add language
         if work.language == "Hebrew":
-            self.graph.add((expression_uri, self.ns.CRM.P72_has_language, self.ns.HM.Hebrew))
+            emit((expression, n3["P72_has_language"], n3["Hebrew"]))
         
         # Link Expression to Manifestation
-        self.graph.add((manuscript_uri, self.ns.LRMOO.R4_embodies, expression_uri))
+        emit((iri_to_n3(manuscript_uri), n3["R4_embodies"], expression))
         
-        return work_uri, expression_uri
+        return uri_ref(work_iri), uri_ref(expression_iri)
     
     def add_classified_entity_relation(
         self,
@@ -345,111 +676,87 @@ class RDFGraphBuilder:
         Returns:
             URI of created event/entity or None
         """
-        from ..models.entities import EntityType
-        
         # Get ontology mapping
         mapping = classified_entity.ontology_mapping
         if not mapping:
             return None
         
+        emit = self._pending.append
+        label = classified_entity.label
+        
         # Handle person relationships
         if classified_entity.entity_type == EntityType.PERSON:
-            person = Person(name=classified_entity.value, role=classified_entity.label)
+            person = Person(name=classified_entity.value, role=label)
             person_uri = self.add_person(person)
+            person_n3 = iri_to_n3(person_uri)
             
             # Add direct property if specified
             if "property" in mapping:
                 property_name = mapping["property"]
-                self.graph.add((manuscript_uri, self.ns.HM[property_name], person_uri))
+                emit((iri_to_n3(manuscript_uri), self.ns.hm(property_name), person_n3))
             
-            # Create event if specified
-            if mapping.get("event_class"):
-                event_uri = URIRef(create_event_uri(
-                    self.base_uri,
-                    manuscript_id,
-                    classified_entity.label.replace(" ", "_"),
-                    0
-                ))
-                
-                event_class = mapping["event_class"]
-                if event_class.startswith("F"):
-                    self.graph.add((event_uri, RDF.type, self.ns.LRMOO[event_class]))
-                else:
-                    self.graph.add((event_uri, RDF.type, self.ns.CRM[event_class]))
-                
-                # Link person to event
-                if mapping.get("event_role"):
-                    self.graph.add((event_uri, self.ns.CRM[mapping["event_role"]], person_uri))
-                
-                return event_uri
+            event_iri = self._ensure_event(manuscript_id, label, mapping)
+            if event_iri is None:
+                return person_uri
             
-            return person_uri
+            # Link person to event
+            if mapping.get("event_role"):
+                emit((iri_to_n3(event_iri), self.ns.crm(mapping["event_role"]), person_n3))
         
         # Handle location relationships
         elif classified_entity.entity_type == EntityType.LOCATION:
             place = Place(name=classified_entity.value)
             place_uri = self.add_place(place)
             
-            # Create event if specified
-            if mapping.get("event_class"):
-                event_uri = URIRef(create_event_uri(
-                    self.base_uri,
-                    manuscript_id,
-                    classified_entity.label.replace(" ", "_"),
-                    0
-                ))
-                
-                event_class = mapping["event_class"]
-                if event_class.startswith("F"):
-                    self.graph.add((event_uri, RDF.type, self.ns.LRMOO[event_class]))
-                else:
-                    self.graph.add((event_uri, RDF.type, self.ns.CRM[event_class]))
-                
-                # Link place to event
-                if mapping.get("place_property"):
-                    self.graph.add((event_uri, self.ns.CRM[mapping["place_property"]], place_uri))
-                
-                return event_uri
+            event_iri = self._ensure_event(manuscript_id, label, mapping)
+            if event_iri is None:
+                return place_uri
             
-            return place_uri
+            # Link place to event
+            if mapping.get("place_property"):
+                emit((iri_to_n3(event_iri), self.ns.crm(mapping["place_property"]), iri_to_n3(place_uri)))
         
         # Handle date relationships
         elif classified_entity.entity_type == EntityType.DATE:
-            timespan_uri = URIRef(create_timespan_uri(self.base_uri, classified_entity.value))
-            self.graph.add((timespan_uri, RDF.type, self.ns.CRM.E52_Time_Span))
-            self.graph.add((timespan_uri, RDFS.label, Literal(classified_entity.value)))
+            timespan = self._add_timespan(classified_entity.value)
             
-            # Create event if specified
-            if mapping.get("event_class"):
-                event_uri = URIRef(create_event_uri(
-                    self.base_uri,
-                    manuscript_id,
-                    classified_entity.label.replace(" ", "_"),
-                    0
-                ))
-                
-                event_class = mapping["event_class"]
-                if event_class.startswith("F"):
-                    self.graph.add((event_uri, RDF.type, self.ns.LRMOO[event_class]))
-                else:
-                    self.graph.add((event_uri, RDF.type, self.ns.CRM[event_class]))
-                
-                # Link timespan to event
-                self.graph.add((event_uri, self.ns.CRM.P4_has_time_span, timespan_uri))
-                
-                # Link event to manuscript
-                if mapping.get("property_to_manuscript"):
-                    prop = mapping["property_to_manuscript"]
-                    if prop.startswith("R"):
-                        self.graph.add((event_uri, self.ns.LRMOO[prop], manuscript_uri))
-                    else:
-                        self.graph.add((event_uri, self.ns.CRM[prop], manuscript_uri))
-                
-                return event_uri
+            event_iri = self._ensure_event(manuscript_id, label, mapping)
+            if event_iri is None:
+                return uri_ref(create_timespan_uri(self.base_uri, classified_entity.value))
+            event = iri_to_n3(event_iri)
             
-            return timespan_uri
+            # Link timespan to event
+            emit((event, self.ns.n3["P4_has_time_span"], timespan))
+            
+            # Link event to manuscript
+            if mapping.get("property_to_manuscript"):
+                prop = self._manuscript_property(mapping["property_to_manuscript"])
+                emit((event, prop, iri_to_n3(manuscript_uri)))
         
-        return None
+        else:
+            return None
+        
+        return uri_ref(event_iri)
+    
+    def _ensure_event(self, manuscript_id: str, label: str, mapping: dict) -> Optional[str]:
+        """
+        Add the event of a classified entity's mapping, if it names one
+        
+        Args:
+            manuscript_id: Manuscript identifier
+            label: Classification label (names the event)
+            mapping: Ontology mapping (event_class gives the event's type)
+        
+        Returns:
+            Event IRI, or None if the mapping has no event_class
+        """
+        event_class = mapping.get("event_class")
+        if not event_class:
+            return None
+        
+        event_iri = create_event_uri(self.base_uri, manuscript_id, label.replace(" ", "_"), 0)
+        self._pending.append((iri_to_n3(event_iri), _RDF_TYPE_N3, self._event_class(event_class)))
+        return event_iri
     
     def add_generic_event(
         self,
@@ -458,48 +765,41 @@ class RDFGraphBuilder:
         index: int = 0
     ) -> URIRef:
         """Add any event type based on EventClass"""
-        event_uri = URIRef(create_event_uri(
+        event_iri = create_event_uri(
             self.base_uri,
             event.manuscript_id,
             event.event_type,
             index
-        ))
+        )
+        subject = iri_to_n3(event_iri)
+        n3 = self.ns.n3
+        emit = self._pending.append
         
         # Add event class
-        if event.event_class.value.startswith("F"):
-            self.graph.add((event_uri, RDF.type, self.ns.LRMOO[event.event_class.value]))
-        else:
-            self.graph.add((event_uri, RDF.type, self.ns.CRM[event.event_class.value]))
+        emit((subject, _RDF_TYPE_N3, self._event_class(event.event_class.value)))
         
         # Link to manuscript (using property from event)
         property_name = event.properties.get("property_to_manuscript", "P16_used_specific_object")
-        if property_name.startswith("R"):
-            self.graph.add((event_uri, self.ns.LRMOO[property_name], manuscript_uri))
-        else:
-            self.graph.add((event_uri, self.ns.CRM[property_name], manuscript_uri))
+        emit((subject, self._manuscript_property(property_name), iri_to_n3(manuscript_uri)))
         
         # Add temporal info
         if event.date:
-            timespan_uri = URIRef(create_timespan_uri(self.base_uri, event.date))
-            self.graph.add((timespan_uri, RDF.type, self.ns.CRM.E52_Time_Span))
-            self.graph.add((timespan_uri, RDFS.label, Literal(event.date)))
-            self.graph.add((event_uri, self.ns.CRM.P4_has_time_span, timespan_uri))
+            emit((subject, n3["P4_has_time_span"], self._add_timespan(event.date)))
         
         # Add spatial info
         if event.place:
             place_uri = self.add_place(event.place)
-            self.graph.add((event_uri, self.ns.CRM.P7_took_place_at, place_uri))
+            emit((subject, n3["P7_took_place_at"], iri_to_n3(place_uri)))
         
         # Add actor
         if event.actor:
             actor_uri = self.add_person(event.actor)
-            self.graph.add((event_uri, self.ns.CRM.P14_carried_out_by, actor_uri))
+            emit((subject, n3["P14_carried_out_by"], iri_to_n3(actor_uri)))
         
         # Label
-        self.graph.add((event_uri, RDFS.label, 
-                       Literal(f"{event.event_type} of MS {event.manuscript_id}", lang="en")))
+        emit((subject, _RDFS_LABEL_N3, literal_to_n3(f"{event.event_type} of MS {event.manuscript_id}", "en")))
         
-        return event_uri
+        return uri_ref(event_iri)
     
     def build_manuscript_graph(self, manuscript: Manuscript) -> None:
         """Build complete RDF graph for a manuscript"""
@@ -515,23 +815,33 @@ class RDFGraphBuilder:
             self.add_work_expression_manifestation(ms_uri, manuscript, manuscript.work)
         
         # Add all events
-        event_counter = {}
+        event_counter = Counter()
         for event in manuscript.events:
             event_type = event.event_type
-            index = event_counter.get(event_type, 0)
-            self.add_generic_event(ms_uri, event, index)
-            event_counter[event_type] = index + 1
+            self.add_generic_event(ms_uri, event, event_counter[event_type])
+            event_counter[event_type] += 1
+        
+        # One batch per manuscript
+        self.flush()
     
     def serialize(self, format: str = 'turtle') -> str:
-        """Serialize graph to string"""
+        """Serialize graph to string (formats other than Turtle/N-Triples via rdflib)"""
+        self.flush()
+        if format in FastTripleWriter.FORMATS:
+            return self.writer.serialize(format)
         return self.graph.serialize(format=format)
     
     def save(self, filepath: str, format: str = 'turtle') -> None:
-        """Save graph to file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.serialize(format=format))
+        """Save graph to file (streamed, without building the whole document string)"""
+        self.flush()
+        if format in FastTripleWriter.FORMATS:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.writelines(self.writer.lines(format))
+        else:
+            self.graph.serialize(destination=filepath, format=format, encoding='utf-8')
     
     @property
     def triple_count(self) -> int:
         """Get total number of triples"""
-        return len(self.graph)
+        self.flush()
+        return len(self.writer)
@@ -3,28 +3,32 @@ Main Extraction Pipeline - Functional Orchestration
 Pure functional composition of extraction → classification → RDF generation
 """
 
-from typing import List, Dict, Optional, Tuple
+import os
+import sys
+from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import replace
 from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from tqdm import tqdm
 
 from .models.entities import (
     Manuscript, ExtractedEntity, ClassifiedEntity, Person, Place, 
-    Work, Event, EventClass, ColophonInfo, ExtractionResult, Config
+    Work, Event, EventClass, EntityType, ColophonInfo, ExtractionResult, Config
 )
 from .extractors.text_extractors import (
     extract_dates, extract_locations, extract_person_mentions,
     extract_colophon_info, extract_work_title, extract_locations_with_kima
 )
 from .extractors.ai_extractor import (
-    create_ai_extractor, extract_batch_with_ai
+    create_ai_extractor, iter_extract_with_ai
 )
 from .classification.grok_classifier import create_classifier, get_ontology_mapping
 from .classification.hebrew_patterns import classify_person_by_patterns, classify_location_by_patterns
 from .ontology.rdf_generator import RDFGraphBuilder, RDF_AVAILABLE
 from .io.data_loader import (
-    load_excel_data, load_gazetteer, save_extraction_results,
-    manuscripts_to_dataframe, save_frequency_tables
+    load_excel_data, load_gazetteer, save_extraction_results
 )
 from .io.kima_loader import KimaGazetteer
 
@@ -82,6 +86,59 @@ def extract_entities_from_text(
     )
 
 
+# Below this many manuscripts, extracting in-process is faster than starting
+# workers (each worker receives its own copy of the gazetteers)
+PARALLEL_EXTRACTION_MIN_MANUSCRIPTS = 1000
+
+# Gazetteers of an extraction worker process, set once by its initializer
+_worker_gazetteers: Tuple[frozenset, Optional[KimaGazetteer]] = (frozenset(), None)
+
+
+def _init_extraction_worker(gazetteer: frozenset, kima_gazetteer: Optional[KimaGazetteer]) -> None:
+    """Worker-process initializer: keep the gazetteers for all of the worker's tasks"""
+    global _worker_gazetteers
+    _worker_gazetteers = (gazetteer, kima_gazetteer)
+
+
+def _extract_one(task: Tuple[str, str, Dict[str, str]]) -> Manuscript:
+    """Worker-process entry point: extract_entities_from_text for a (text, id, metadata) task"""
+    text, manuscript_id, source_metadata = task
+    gazetteer, kima_gazetteer = _worker_gazetteers
+    return extract_entities_from_text(text, manuscript_id, gazetteer, source_metadata, kima_gazetteer)
+
+
+def extract_all_entities(
+    tasks: List[Tuple[str, str, Dict[str, str]]],
+    gazetteer: frozenset,
+    kima_gazetteer: Optional[KimaGazetteer] = None,
+    max_workers: Optional[int] = None
+) -> List[Manuscript]:
+    """
+    Extract entities for (text, manuscript_id, source_metadata) tasks, in order
+    
+    Args:
+        tasks: One (text, manuscript_id, source_metadata) tuple per manuscript
+        gazetteer: Location gazetteer (legacy)
+        kima_gazetteer: Optional Kima gazetteer
+        max_workers: Worker processes (None/1 extracts in-process)
+        
+    Returns:
+        Manuscripts in task order
+    """
+    if not max_workers or max_workers <= 1 or len(tasks) < PARALLEL_EXTRACTION_MIN_MANUSCRIPTS:
+        return [
+            extract_entities_from_text(text, manuscript_id, gazetteer, source_metadata, kima_gazetteer)
+            for text, manuscript_id, source_metadata in tasks
+        ]
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_extraction_worker,
+        initargs=(gazetteer, kima_gazetteer)
+    ) as executor:
+        return list(executor.map(_extract_one, tasks, chunksize=32))
+
+
 def classify_entities(
     manuscripts: List[Manuscript],
     classifier
@@ -103,30 +160,36 @@ def classify_entities(
     print(f"Classifying entities for {len(manuscripts)} manuscripts...")
     
     all_classified = {}
+    to_classify = []
     
-    # Progress bar for manuscript processing
-    for ms in tqdm(manuscripts, desc="Classifying manuscripts", unit="ms"):
+    for ms in manuscripts:
         if not ms.dates and not ms.locations and not ms.persons:
             continue
         
-        # Convert Person objects to ExtractedEntity objects for classification
-        from .models.entities import EntityType
-        person_entities = [
-            ExtractedEntity(
-                value=p.name,
-                entity_type=EntityType.PERSON,
-                context=ms.notes_text,
-                confidence=1.0
+        # Combine dates, locations, AND persons (converted to ExtractedEntity
+        # objects for classification) into a single list
+        all_entities = list(chain(
+            ms.dates,
+            ms.locations,
+            (
+                ExtractedEntity(
+                    value=p.name,
+                    entity_type=EntityType.PERSON,
+                    context=ms.notes_text,
+                    confidence=1.0
+                )
+                for p in ms.persons
             )
-            for p in ms.persons
-        ]
-        
-        # Combine dates, locations, AND persons
-        all_entities = ms.dates + ms.locations + person_entities
-        
-        # Classify (now includes persons!)
-        classified = classifier.classify_entities(ms.notes_text, all_entities)
-        
+        ))
+        to_classify.append((ms, all_entities))
+    
+    # Classify (now includes persons!); API calls for several manuscripts
+    # run concurrently, results come back in manuscript order
+    results = classifier.classify_entities_batch(
+        [(ms.notes_text, all_entities) for ms, all_entities in to_classify]
+    )
+    
+    for (ms, _), classified in zip(to_classify, results):
         if classified:
             all_classified[ms.manuscript_id] = classified
     
@@ -166,8 +229,13 @@ def classify_entities_hybrid(
     person_pattern_successes = 0
     person_pattern_attempts = 0
     
-    # Phase 1: Try Hebrew patterns for all manuscripts
-    for ms in tqdm(manuscripts, desc="Pattern classification", unit="ms"):
+    # Phase 1: Try Hebrew patterns for all manuscripts (microseconds each,
+    # so the bar refreshes at most twice a second and in ~200 steps)
+    progress = tqdm(
+        manuscripts, desc="Pattern classification", unit="ms",
+        mininterval=0.5, smoothing=0, miniters=max(1, len(manuscripts) // 200)
+    )
+    for ms in progress:
         if not ms.dates and not ms.locations and not ms.persons:
             continue
         
@@ -184,7 +252,6 @@ def classify_entities_hybrid(
                 # Pattern matched! Create classified entity
                 person_pattern_successes += 1
                 pattern_successes += 1
-                from .models.entities import EntityType
                 entity = ExtractedEntity(
                     value=person.name,
                     entity_type=EntityType.PERSON,
@@ -203,7 +270,6 @@ def classify_entities_hybrid(
                 classified_entities.append(classified)
             else:
                 # No pattern matched - needs AI
-                from .models.entities import EntityType
                 entity = ExtractedEntity(
                     value=person.name,
                     entity_type=EntityType.PERSON,
@@ -222,7 +288,6 @@ def classify_entities_hybrid(
                 # Pattern matched! Create classified entity
                 location_pattern_successes += 1
                 pattern_successes += 1
-                from .models.entities import EntityType
                 
                 ontology_mapping = get_ontology_mapping(role)
                 
@@ -237,7 +302,6 @@ def classify_entities_hybrid(
                 unclassified_entities.append(location)
         
         # Dates always need AI classification (no patterns yet)
-        from .models.entities import EntityType
         unclassified_entities.extend(ms.dates)
         
         # If we have classified entities from patterns, store them
@@ -257,10 +321,12 @@ def classify_entities_hybrid(
     if needs_ai_classification:
         print(f"\n  Step 2: Using Grok AI for {len(needs_ai_classification)} manuscripts with unclassified entities...")
         
-        for ms, unclassified in tqdm(needs_ai_classification, desc="AI classification", unit="ms"):
-            # Classify using Grok
-            ai_classified = classifier.classify_entities(ms.notes_text, unclassified)
-            
+        # Concurrent API calls (several manuscripts per request with batch_size > 1)
+        ai_results = classifier.classify_entities_batch(
+            [(ms.notes_text, unclassified) for ms, unclassified in needs_ai_classification]
+        )
+        
+        for (ms, _), ai_classified in zip(needs_ai_classification, ai_results):
             if ai_classified:
                 # Merge with pattern-based classifications
                 if ms.manuscript_id in all_classified:
@@ -275,6 +341,21 @@ def classify_entities_hybrid(
     return all_classified
 
 
+@lru_cache(maxsize=64)
+def _event_class(name: Optional[str]) -> EventClass:
+    """Pure helper: EventClass for an ontology event_class name (E7_Activity if unknown)"""
+    try:
+        return EventClass(name)
+    except ValueError:
+        return EventClass.E7_ACTIVITY
+
+
+@lru_cache(maxsize=256)
+def _event_type(label: str) -> str:
+    """Pure helper: Event type for a classification label ("copying date" → "copying")"""
+    return label.replace(" date", "").replace(" in", "")
+
+
 def create_events_from_classified(
     manuscript: Manuscript,
     classified_entities: List[ClassifiedEntity]
@@ -291,23 +372,15 @@ def create_events_from_classified(
     """
     events: List[Event] = []
     
-    # Group by event type
-    events_by_type = defaultdict(list)
-    
     for classified in classified_entities:
+        # Mappings are shared per label (get_ontology_mapping is cached),
+        # so events of one role reference the same properties dict
         ontology_mapping = classified.ontology_mapping
-        event_class_name = ontology_mapping.get("event_class", "E7_Activity")
-        
-        # Try to get EventClass enum
-        try:
-            event_class = EventClass(event_class_name)
-        except ValueError:
-            event_class = EventClass.E7_ACTIVITY
-        
-        event_type = classified.label.replace(" date", "").replace(" in", "")
+        event_class = _event_class(ontology_mapping.get("event_class", "E7_Activity"))
+        event_type = _event_type(classified.label)
         
         # Create event
-        if classified.entity_type.value == "date":
+        if classified.entity_type is EntityType.DATE:
             event = Event(
                 event_type=event_type,
                 event_class=event_class,
@@ -316,7 +389,7 @@ def create_events_from_classified(
                 properties=ontology_mapping
             )
             events.append(event)
-        elif classified.entity_type.value == "location":
+        elif classified.entity_type is EntityType.LOCATION:
             # Find matching date event if any
             place = Place(name=classified.value)
             
@@ -350,19 +423,20 @@ def enrich_manuscript_with_classification(
     events = create_events_from_classified(manuscript, classified_entities)
     
     # Create new manuscript with events (immutable update)
-    return Manuscript(
-        manuscript_id=manuscript.manuscript_id,
-        notes_text=manuscript.notes_text,
-        dates=manuscript.dates,
-        locations=manuscript.locations,
-        persons=manuscript.persons,
-        colophon=manuscript.colophon,
-        work=manuscript.work,
-        expression=manuscript.expression,
-        events=events,
-        nli_uri=manuscript.nli_uri,
-        source_metadata=manuscript.source_metadata
-    )
+    return replace(manuscript, events=events)
+
+
+# Below this many manuscripts, building the graph in-process is faster than
+# shipping manuscripts to worker processes and their triples back
+PARALLEL_GRAPH_MIN_MANUSCRIPTS = 20000
+
+
+def _build_graph_triples(manuscripts: List[Manuscript], config: Config) -> Set[Tuple[str, str, str]]:
+    """Pure helper: N-Triples of a chunk of manuscripts' graph (worker-process entry point)"""
+    builder = RDFGraphBuilder(config)
+    for ms in manuscripts:
+        builder.build_manuscript_graph(ms)
+    return builder.writer.triples
 
 
 def build_knowledge_graph(
@@ -386,9 +460,19 @@ def build_knowledge_graph(
     print(f"Building RDF knowledge graph...")
     
     builder = RDFGraphBuilder(config)
-    
-    for ms in manuscripts:
-        builder.build_manuscript_graph(ms)
+    workers = config.output_workers or os.cpu_count() or 1
+    
+    if workers > 1 and len(manuscripts) >= PARALLEL_GRAPH_MIN_MANUSCRIPTS:
+        # Chunks build their triples in worker processes; the builder's
+        # triple set merges them (and drops shared persons/places twice seen)
+        chunksize = -(-len(manuscripts) // workers)
+        chunks = [manuscripts[i:i + chunksize] for i in range(0, len(manuscripts), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for triples in executor.map(_build_graph_triples, chunks, repeat(config)):
+                builder.add_triples(triples)
+    else:
+        for ms in manuscripts:
+            builder.build_manuscript_graph(ms)
     
     print(f"✓ Knowledge graph built: {builder.triple_count} triples")
     
@@ -399,6 +483,42 @@ def build_knowledge_graph(
 # MAIN PIPELINE ORCHESTRATION
 # ============================================================================
 
+def manuscript_rows(df) -> List[Tuple[str, str, Dict[str, str]]]:
+    """
+    Pure function: (notes text, manuscript ID, source metadata) per DataFrame row
+    
+    Converts each column to strings once, as a whole list, and zips the
+    columns into rows, instead of building a Series per row with iterrows()
+    and filtering the column list for every row.
+    
+    Args:
+        df: DataFrame from load_excel_data()
+        
+    Returns:
+        One tuple per row; source metadata holds every column except the
+        combined notes and the ID
+    """
+    cols = df.columns.tolist()
+    # tolist() yields Python scalars (NaN stays a float), so str() renders
+    # every cell exactly as str(row[col]) did
+    columns = [list(map(str, df.iloc[:, i].tolist())) for i in range(len(cols))]
+    
+    texts = columns[cols.index("combined_notes")] if "combined_notes" in cols else repeat("")
+    # IDs are interned: they key classified_map and the enrichment/CSV lookups
+    ids = columns[cols.index("001")] if "001" in cols else [f"MS_{idx}" for idx in df.index]
+    ids = list(map(sys.intern, ids))
+    
+    # Source metadata: every column except combined notes and ID
+    meta_cols = [col for col in cols if col not in ("combined_notes", "001")]
+    meta_columns = [column for col, column in zip(cols, columns) if col not in ("combined_notes", "001")]
+    meta_rows = zip(*meta_columns) if meta_columns else repeat(())
+    
+    return [
+        (text, ms_id, dict(zip(meta_cols, meta)))
+        for text, ms_id, meta in zip(texts, ids, meta_rows)
+    ]
+
+
 def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = None) -> ExtractionResult:
     """
     Main extraction pipeline - orchestrates all steps
@@ -419,24 +539,24 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
     
     # Step 1: Load data
     print("Step 1: Loading data...")
+    
+    # Limit manuscripts if requested (for testing); only the needed rows are read
+    if max_manuscripts:
+        print(f"📊 TEST MODE: Limiting to first {max_manuscripts} manuscripts")
+    
     df = load_excel_data(
         config.input_excel_path,
         id_column="001",
-        notes_columns=["957$a", "500$a", "561$a"]  # Multiple note fields
+        notes_columns=["957$a", "500$a", "561$a"],  # Multiple note fields
+        max_manuscripts=max_manuscripts
     )
     
-    # Limit manuscripts if requested (for testing)
-    if max_manuscripts and len(df) > max_manuscripts:
-        print(f"📊 TEST MODE: Limiting to first {max_manuscripts} manuscripts")
-        df = df.head(max_manuscripts)
-    
     print(f"✓ Loaded {len(df)} manuscripts")
     
     # Load gazetteer (legacy or Kima)
     kima_gazetteer = None
     if config.use_kima:
         # Load Kima/Maagarim gazetteer
-        import os
         kima_dir = os.path.join(os.path.dirname(config.input_excel_path), "input", "sinai")
         if not os.path.exists(kima_dir):
             # Try alternative path
@@ -479,7 +599,6 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
         print("🤖 AI-ONLY MODE: Using Grok for entity extraction")
         
         # Create fallback directory for failed JSON responses
-        import os
         fallback_dir = os.path.join(config.output_dir, "ai_fallback_responses")
         
         # Create AI extractor
@@ -492,26 +611,21 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
         print(f"  → Fallback responses will be saved to: {fallback_dir}")
         
         # Prepare data for batch extraction
-        texts_data = []
-        for idx, row in df.iterrows():
-            text = str(row.get("combined_notes", ""))
-            ms_id = str(row.get("001", f"MS_{idx}"))
-            
-            # Get source metadata (exclude combined notes and ID)
-            source_metadata = {
-                col: str(row.get(col, ""))
-                for col in df.columns
-                if col not in ["combined_notes", "001"]
-            }
-            
-            texts_data.append((text, ms_id, source_metadata))
+        texts_data = manuscript_rows(df)
         
-        # Extract using AI (returns manuscripts AND classified entities)
-        manuscripts, classified_map = extract_batch_with_ai(
+        # Extract using AI (manuscripts paired with their classified entities),
+        # adding each manuscript's events as it arrives
+        manuscripts = []
+        classified_map = {}
+        for manuscript, classified_entities in iter_extract_with_ai(
             texts=texts_data,
             extractor=ai_extractor,
             show_progress=True
-        )
+        ):
+            if classified_entities:
+                classified_map[manuscript.manuscript_id] = classified_entities  # for the CSV export
+                manuscript = enrich_manuscript_with_classification(manuscript, classified_entities)
+            manuscripts.append(manuscript)
         
         print(f"✓ AI extracted {len(manuscripts)} manuscripts with classifications")
         
@@ -521,27 +635,26 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
         
         classified_map = {}  # Will be populated in classification step
         
-        for idx, row in df.iterrows():
-            text = str(row.get("combined_notes", ""))
-            ms_id = str(row.get("001", f"MS_{idx}"))
-            
-            # Get source metadata (exclude combined notes and ID)
-            source_metadata = {
-                col: str(row.get(col, ""))
-                for col in df.columns
-                if col not in ["combined_notes", "001"]
-            }
-            
-            manuscript = extract_entities_from_text(
-                text, ms_id, gazetteer, source_metadata, kima_gazetteer
-            )
-            manuscripts.append(manuscript)
+        tasks = manuscript_rows(df)
+        
+        manuscripts = extract_all_entities(
+            tasks, gazetteer, kima_gazetteer,
+            max_workers=config.extraction_workers or os.cpu_count() or 1
+        )
+    
+    # Entity totals in one pass (enrichment below only adds events)
+    total_dates = total_locations = total_persons = total_colophons = 0
+    for m in manuscripts:
+        total_dates += len(m.dates)
+        total_locations += len(m.locations)
+        total_persons += len(m.persons)
+        total_colophons += m.has_colophon
     
     print(f"✓ Extracted entities from {len(manuscripts)} manuscripts")
-    print(f"  - Total dates: {sum(len(m.dates) for m in manuscripts)}")
-    print(f"  - Total locations: {sum(len(m.locations) for m in manuscripts)}")
-    print(f"  - Total persons: {sum(len(m.persons) for m in manuscripts)}")
-    print(f"  - Colophons found: {sum(1 for m in manuscripts if m.has_colophon)}")
+    print(f"  - Total dates: {total_dates}")
+    print(f"  - Total locations: {total_locations}")
+    print(f"  - Total persons: {total_persons}")
+    print(f"  - Colophons found: {total_colophons}")
     
     # Step 3: Classify entities (optional in AI-only mode)
     if config.ai_only:
@@ -559,19 +672,15 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
         classifier = create_classifier(config)
         classified_map = classify_entities(manuscripts, classifier)
     
-    # Enrich manuscripts with events
-    enriched_manuscripts = []
-    for ms in manuscripts:
-        if ms.manuscript_id in classified_map:
-            enriched = enrich_manuscript_with_classification(
-                ms, 
-                classified_map[ms.manuscript_id]
-            )
-            enriched_manuscripts.append(enriched)
-        else:
-            enriched_manuscripts.append(ms)
-    
-    manuscripts = enriched_manuscripts
+    # Enrich manuscripts with events (AI-only manuscripts already have theirs),
+    # replacing each in place so un-enriched copies are released as we go
+    if not config.ai_only:
+        classified_for = classified_map.get  # bound once for the loop
+        for i, ms in enumerate(manuscripts):
+            # One lookup; manuscripts with nothing classified are left as they are
+            classified = classified_for(ms.manuscript_id)
+            if classified:
+                manuscripts[i] = enrich_manuscript_with_classification(ms, classified)
     
     total_events = sum(len(m.events) for m in manuscripts)
     print(f"✓ Created {total_events} structured events")
@@ -588,20 +697,17 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
         ExtractionResult(
             manuscripts=manuscripts,
             extraction_date=datetime.now(),
-            total_dates_extracted=sum(len(m.dates) for m in manuscripts),
-            total_locations_extracted=sum(len(m.locations) for m in manuscripts),
-            total_persons_extracted=sum(len(m.persons) for m in manuscripts),
+            total_dates_extracted=total_dates,
+            total_locations_extracted=total_locations,
+            total_persons_extracted=total_persons,
             total_events_created=total_events
         ),
         output_dir=config.output_dir,
-        classified_map=classified_map if classified_map else None
+        classified_map=classified_map if classified_map else None,
+        max_workers=config.output_workers or os.cpu_count() or 1,
+        frequency_tables=True
     )
     
-    # Save frequency tables
-    manuscripts_df = manuscripts_to_dataframe(manuscripts, classified_map if classified_map else None)
-    freq_files = save_frequency_tables(manuscripts_df, config.output_dir)
-    saved_files.update(freq_files)
-    
     # Save RDF outputs
     if graph_builder:
         # Turtle format
@@ -622,11 +728,11 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
     print("="*80)
     print(f"\nSummary:")
     print(f"  - Manuscripts processed: {len(manuscripts)}")
-    print(f"  - Dates extracted: {sum(len(m.dates) for m in manuscripts)}")
-    print(f"  - Locations extracted: {sum(len(m.locations) for m in manuscripts)}")
-    print(f"  - Persons extracted: {sum(len(m.persons) for m in manuscripts)}")
+    print(f"  - Dates extracted: {total_dates}")
+    print(f"  - Locations extracted: {total_locations}")
+    print(f"  - Persons extracted: {total_persons}")
     print(f"  - Events created: {total_events}")
-    print(f"  - Colophons detected: {sum(1 for m in manuscripts if m.has_colophon)}")
+    print(f"  - Colophons detected: {total_colophons}")
     if graph_builder:
         print(f"  - RDF triples: {graph_builder.triple_count}")
     
@@ -637,8 +743,8 @@ def run_extraction_pipeline(config: Config, max_manuscripts: Optional[int] = Non
     return ExtractionResult(
         manuscripts=manuscripts,
         extraction_date=datetime.now(),
-        total_dates_extracted=sum(len(m.dates) for m in manuscripts),
-        total_locations_extracted=sum(len(m.locations) for m in manuscripts),
-        total_persons_extracted=sum(len(m.persons) for m in manuscripts),
+        total_dates_extracted=total_dates,
+        total_locations_extracted=total_locations,
+        total_persons_extracted=total_persons,
         total_events_created=total_events
     )
@@ -0,0 +1,53 @@
+"""
+Tests for the parsed-workbook cache of load_excel_data (Parquet beside the
+workbook, reused while the workbook's size and mtime are unchanged).
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("openpyxl")
+
+from src.io import data_loader
+from src.io.data_loader import PARSE_CACHE_SUFFIX, load_excel_data
+
+
+@pytest.fixture
+def mixed_workbook(tmp_path):
+    """Workbook whose 260$c column mixes numbers and text"""
+    path = tmp_path / "mixed.xlsx"
+    pd.DataFrame({
+        "001": [990001, 990002, 990003],
+        "500$a": ["נכתב בשנת תי\"ח", "note two", None],
+        "260$c": [1650, 'שנת תי"ח', None],
+    }).to_excel(path, index=False)
+    return str(path)
+
+
+def test_mixed_column_is_cached_and_reused(mixed_workbook, monkeypatch, capsys):
+    first = load_excel_data(mixed_workbook)
+    assert "Could not write parse cache" not in capsys.readouterr().out
+    assert Path(mixed_workbook + PARSE_CACHE_SUFFIX).exists()
+
+    # The second load must not parse the workbook again
+    def fail_read_excel(*args, **kwargs):
+        raise AssertionError("workbook re-parsed instead of read from the cache")
+    monkeypatch.setattr(data_loader.pd, "read_excel", fail_read_excel)
+    second = load_excel_data(mixed_workbook)
+
+    assert len(second) == len(first) == 2
+    assert second["260$c"].map(str).tolist() == first["260$c"].map(str).tolist()
+    assert second["combined_notes"].tolist() == first["combined_notes"].tolist()
+    assert data_loader.make_field_maps(second) == data_loader.make_field_maps(first)
+
+
+def test_changed_workbook_is_parsed_again(mixed_workbook):
+    load_excel_data(mixed_workbook)
+
+    pd.DataFrame({"001": [990009], "500$a": ["replaced"]}).to_excel(mixed_workbook, index=False)
+    reloaded = load_excel_data(mixed_workbook)
+
+    assert reloaded["combined_notes"].tolist() == ["replaced"]
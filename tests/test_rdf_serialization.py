@@ -0,0 +1,134 @@
+"""
+Round-trip tests for the hand-written Turtle / N-Triples serializer
+(FastTripleWriter): both formats must parse back with rdflib to the same graph.
+"""
+
+import pytest
+
+rdflib = pytest.importorskip("rdflib")
+from rdflib.compare import isomorphic
+
+from src.models.entities import Config, Manuscript, ColophonInfo
+from src.ontology.rdf_generator import (
+    FastTripleWriter, RDFGraphBuilder, iri_to_n3, literal_to_n3, _RDF_TYPE_N3
+)
+
+
+EX = "http://example.org/ns/"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+PREFIXES = {
+    "ex": EX,
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+# Lexical forms that need escaping in both formats
+TRICKY_TEXTS = [
+    'say "shalom"',
+    "back\\slash and \\n (not a newline)",
+    "line one\nline two\r\nline three",
+    'all of them: "\\"\n',
+    "כתב יד \"אשכנזי\"",
+    "",
+]
+
+# Local names: some can be written as ex:name, the rest must keep the full IRI
+TRICKY_LOCAL_NAMES = [
+    "plain",
+    "ends.with.dot.",
+    "-starts-with-dash",
+    "has.inner.dots",
+    "has-inner-dashes",
+    "1starts_with_digit",
+    "percent%20escaped",
+    "comma,separated",
+    "~tilde",
+    "path/segment",
+    "ירושלים",
+    "",
+]
+
+
+def _parse(data: str, format: str) -> "rdflib.Graph":
+    graph = rdflib.Graph()
+    graph.parse(data=data, format=format)
+    return graph
+
+
+def _assert_round_trip(writer: FastTripleWriter) -> None:
+    turtle = _parse(writer.serialize("turtle"), "turtle")
+    ntriples = _parse(writer.serialize("nt"), "nt")
+
+    assert len(turtle) == len(writer)
+    assert len(ntriples) == len(writer)
+    assert isomorphic(turtle, ntriples)
+
+
+def _tricky_writer() -> FastTripleWriter:
+    writer = FastTripleWriter(PREFIXES)
+    subject = iri_to_n3(EX + "subject")
+    for index, local in enumerate(TRICKY_LOCAL_NAMES):
+        term = iri_to_n3(EX + local)
+        writer.add(term, _RDF_TYPE_N3, iri_to_n3(EX + "Thing"))
+        writer.add(subject, iri_to_n3(EX + "links"), term)
+        if local:
+            writer.add(subject, term, literal_to_n3(index))
+    for text in TRICKY_TEXTS:
+        writer.add(subject, iri_to_n3(EX + "plain"), literal_to_n3(text))
+        writer.add(subject, iri_to_n3(EX + "hebrew"), literal_to_n3(text, "he"))
+        writer.add(subject, iri_to_n3(EX + "typed"), literal_to_n3(text, datatype=XSD_STRING))
+    return writer
+
+
+def test_tricky_terms_round_trip():
+    _assert_round_trip(_tricky_writer())
+
+
+def test_tricky_terms_parse_to_expected_graph():
+    writer = _tricky_writer()
+    expected = rdflib.Graph()
+    subject = rdflib.URIRef(EX + "subject")
+    for local in TRICKY_LOCAL_NAMES:
+        term = rdflib.URIRef(EX + local)
+        expected.add((term, rdflib.RDF.type, rdflib.URIRef(EX + "Thing")))
+        expected.add((subject, rdflib.URIRef(EX + "links"), term))
+    for text in TRICKY_TEXTS:
+        expected.add((subject, rdflib.URIRef(EX + "plain"), rdflib.Literal(text)))
+        expected.add((subject, rdflib.URIRef(EX + "hebrew"), rdflib.Literal(text, lang="he")))
+        expected.add((subject, rdflib.URIRef(EX + "typed"), rdflib.Literal(text, datatype=rdflib.XSD.string)))
+
+    turtle = _parse(writer.serialize("turtle"), "turtle")
+    for triple in expected:
+        assert triple in turtle
+
+
+def test_rdf_type_outside_predicate_position():
+    writer = FastTripleWriter(PREFIXES)
+    thing = iri_to_n3(EX + "Thing")
+    writer.add(_RDF_TYPE_N3, iri_to_n3(EX + "note"), literal_to_n3("rdf:type as subject"))
+    writer.add(thing, iri_to_n3(EX + "relatedTo"), _RDF_TYPE_N3)
+    writer.add(thing, _RDF_TYPE_N3, _RDF_TYPE_N3)
+
+    _assert_round_trip(writer)
+    turtle = _parse(writer.serialize("turtle"), "turtle")
+    assert (rdflib.RDF.type, rdflib.URIRef(EX + "note"), rdflib.Literal("rdf:type as subject")) in turtle
+    assert (rdflib.URIRef(EX + "Thing"), rdflib.URIRef(EX + "relatedTo"), rdflib.RDF.type) in turtle
+    assert (rdflib.URIRef(EX + "Thing"), rdflib.RDF.type, rdflib.RDF.type) in turtle
+
+
+def test_builder_output_round_trips():
+    builder = RDFGraphBuilder(Config(input_excel_path="", output_dir=""))
+    for manuscript_id in ['990001"2', "9900\\03", "990004.", "-990005", "9900 06"]:
+        builder.build_manuscript_graph(Manuscript(
+            manuscript_id=manuscript_id,
+            notes_text="",
+            colophon=ColophonInfo(
+                text='נשלם "ספר" \\ בעזרת\nהשם',
+                has_completion_marker=True,
+                scribe_name="יוסף.",
+            ),
+        ))
+
+    _assert_round_trip(builder.writer)
+    assert isomorphic(_parse(builder.serialize("turtle"), "turtle"), builder.graph)